@@ -1,20 +1,236 @@
 """Main Textual TUI application for GitHub branch management."""
 
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache, total_ordering
+from operator import attrgetter
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from rich.text import Text
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Horizontal, Vertical
+from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Static
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, WorkerState, get_current_worker
 
+from . import cache
 from .github_api import BranchInfo, GitHubBranchManager, MergeStatus, PRStatus
 
+# (label, key) for each table column; keys let single cells be updated in place
+COLUMNS = (
+    ("Sel", "sel"),
+    ("Branch Name", "name"),
+    ("Status", "status"),
+    ("Info", "info"),
+    ("Last Updated", "updated"),
+)
+
+# Cell values of a table row, in column order
+RowCells = Tuple[str, str, str, str, str]
+
+# Maps 3-character substrings of branch names to name column indices, in
+# ascending order
+TrigramIndex = Dict[str, List[int]]
+
+# Colors for each branch status; anything else is dimmed
+STATUS_STYLES = {
+    "identical": "blue",
+    "behind": "green",
+    "ahead": "yellow",
+    "diverged": "red",
+    "protected": "bold yellow",
+    "fetching": "dim italic",
+}
+
+# Display order of branch statuses when sorting by status
+STATUS_ORDER = {
+    "protected": 0,
+    "diverged": 1,
+    "ahead": 2,
+    "behind": 3,
+    "identical": 4,
+    "fetching": 5,
+    "unknown": 6,
+}
+
+# (key function, reverse) for each sort mode
+SORT_KEYS: Dict[str, Tuple[Callable[[BranchInfo], Any], bool]] = {
+    "name": (attrgetter("name"), False),
+    "status": (
+        lambda b: (STATUS_ORDER.get(b.status, len(STATUS_ORDER)), b.name),
+        False,
+    ),
+    "merged": (lambda b: (not b.is_merged, b.name), False),
+    # Most recent first (None values last)
+    "updated": (
+        lambda b: (b.last_commit_date is None, b.last_commit_date or ""),
+        True,
+    ),
+}
+
+
+@total_ordering
+class _Descending:
+    """Sort key wrapper that orders the wrapped key in reverse."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+
+def _sort_index_key(sort_mode: str) -> Callable[[BranchInfo], Any]:
+    """Get the ascending key the sort index of a sort mode is ordered by.
+
+    Reversed modes invert their key rather than the whole index, so branches
+    with equal keys stay in ascending name order, as a stable reversed sort
+    of the name-ordered listing would show them.
+    """
+    key, reverse = SORT_KEYS[sort_mode]
+    if not reverse:
+        return key
+    return lambda branch: _Descending(key(branch))
+
+
+# BranchInfo field each sort mode orders by, besides the name
+SORT_FIELDS: Dict[str, Optional[str]] = {
+    "name": None,
+    "status": "status",
+    "merged": "merge_status",
+    "updated": "last_commit_date",
+}
+
+
+@lru_cache(maxsize=512)
+def _status_display(
+    status: str, ahead_by: Optional[int], behind_by: Optional[int]
+) -> str:
+    """Build the markup of a status cell.
+
+    Memoized since the same status/ahead/behind combinations repeat across
+    many branches and on every redraw. Returning markup rather than a rich
+    Text lets the DataTable parse it only for rows it actually paints.
+    """
+    # Build status text with ahead/behind info
+    status_str = status
+    if status in ("ahead", "behind", "diverged"):
+        parts = [status]
+        if ahead_by is not None and ahead_by > 0:
+            parts.append(f"↑{ahead_by}")
+        if behind_by is not None and behind_by > 0:
+            parts.append(f"↓{behind_by}")
+        status_str = " ".join(parts)
+
+    return f"[{STATUS_STYLES.get(status, 'dim')}]{status_str}[/]"
+
+
+def _add_trigrams(index: TrigramIndex, idx: int, name_lower: str) -> None:
+    """Add the name at column index ``idx`` to the postings of its trigrams."""
+    for i in range(len(name_lower) - 2):
+        postings = index.setdefault(name_lower[i : i + 3], [])
+        # A trigram repeated within the name is posted once
+        if not postings or postings[-1] != idx:
+            postings.append(idx)
+
+
+@dataclass(frozen=True)
+class NameColumns:
+    """Branch names in ``branches_data`` order, and their trigram index.
+
+    The app only ever appends to the lists and postings or replaces them, so
+    this is a fixed snapshot of the first ``count`` names: a worker can read
+    it while more branches stream in, ignoring indices past ``count``.
+    """
+
+    names: List[str]
+    names_lower: List[str]
+    trigrams: TrigramIndex
+    count: int
+
+    @classmethod
+    def of(cls, branches: List[BranchInfo]) -> "NameColumns":
+        """Build the columns of a list of branches."""
+        names_lower = [b.name_lower for b in branches]
+        trigrams: TrigramIndex = {}
+        for idx, name_lower in enumerate(names_lower):
+            _add_trigrams(trigrams, idx, name_lower)
+        return cls([b.name for b in branches], names_lower, trigrams, len(branches))
+
+
+def _trigram_candidates(index: TrigramIndex, needle: str) -> Set[int]:
+    """Get the name indices of branches containing every trigram of ``needle``.
+
+    ``needle`` must be at least 3 characters long. Candidates still need a
+    substring check, as sharing all trigrams does not imply containment.
+    """
+    postings = sorted(
+        (index.get(needle[i : i + 3], ()) for i in range(len(needle) - 2)),
+        key=len,
+    )
+    # Intersect smallest first so the working set only ever shrinks
+    return set(postings[0]).intersection(*postings[1:])
+
+
+@lru_cache(maxsize=1024)
+def _markup_width(markup: str) -> int:
+    """Get the rendered width of a markup cell value."""
+    return Text.from_markup(markup).cell_len
+
+
+@lru_cache(maxsize=64)
+def _info_display(
+    merge_status: MergeStatus,
+    pr_status: PRStatus,
+    is_protected: bool,
+    is_default: bool,
+) -> str:
+    """Build the text of an info cell.
+
+    Memoized since there are only a few dozen possible combinations.
+    """
+    info_parts = []
+
+    # Show merge status
+    if merge_status == MergeStatus.MERGED:
+        info_parts.append("merged")
+    elif merge_status == MergeStatus.FETCHING:
+        info_parts.append("merge:fetching")
+
+    # Show PR status
+    if pr_status == PRStatus.CLOSED:
+        info_parts.append("PR closed")
+    elif pr_status == PRStatus.FETCHING:
+        info_parts.append("PR:fetching")
+
+    if is_protected:
+        info_parts.append("protected")
+    if is_default:
+        info_parts.append("default")
+
+    return ", ".join(info_parts) if info_parts else ""
+
 
 class ConfirmDeleteScreen(ModalScreen[bool]):
     """Modal screen for confirming branch deletion."""
@@ -31,6 +247,9 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
         Binding("escape", "dismiss(False)", "Cancel", priority=True),
     ]
 
+    # Branch names listed individually before summarizing the rest
+    MAX_LISTED_BRANCHES = 100
+
     def __init__(self, branch_count: int, branch_names: List[str]):
         super().__init__()
         self.branch_count = branch_count
@@ -42,15 +261,13 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
             yield Label(
                 f"⚠️  Delete {self.branch_count} branch(es)?", id="confirm-title"
             )
-            yield Label(
-                "\n".join(f"  • {name}" for name in self.branch_names[:10])
-                + (
-                    f"\n  ... and {len(self.branch_names) - 10} more"
-                    if len(self.branch_names) > 10
-                    else ""
-                ),
-                id="confirm-branches",
-            )
+            with VerticalScroll(id="confirm-branches"):
+                for name in self.branch_names[: self.MAX_LISTED_BRANCHES]:
+                    yield Label(f"  • {name}")
+                if len(self.branch_names) > self.MAX_LISTED_BRANCHES:
+                    yield Label(
+                        f"  ... and {len(self.branch_names) - self.MAX_LISTED_BRANCHES} more"
+                    )
             with Horizontal(id="confirm-buttons"):
                 yield Button("Yes (Y)", variant="error", id="yes-button")
                 yield Button("No (N)", variant="primary", id="no-button")
@@ -72,6 +289,18 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
+class UICall(Message):
+    """A call for the UI thread, posted without waiting for it to run.
+
+    Posted calls run in order, after any posted before them.
+    """
+
+    def __init__(self, callback: Callable[..., Any], *args: Any):
+        super().__init__()
+        self.callback = callback
+        self.args = args
+
+
 class BranchManagerApp(App):
     """A Textual app for managing GitHub branches."""
 
@@ -121,6 +350,7 @@ class BranchManagerApp(App):
 
     #confirm-branches {
         margin-bottom: 1;
+        height: auto;
         max-height: 15;
         overflow-y: auto;
     }
@@ -160,6 +390,13 @@ class BranchManagerApp(App):
         Binding("q", "quit", "Quit", priority=True),
     ]
 
+    # Streamed branch updates are sent to the UI thread in batches of this
+    # size, or after this many seconds, whichever comes first
+    UPDATE_BATCH_SIZE = 20
+    UPDATE_BATCH_INTERVAL = 0.1
+    # Minimum seconds between table rebuilds while a fetch is streaming
+    STREAM_RENDER_INTERVAL = 0.1
+
     def __init__(self):
         super().__init__()
         self.gh_manager = GitHubBranchManager()
@@ -169,6 +406,46 @@ class BranchManagerApp(App):
         self.filter_text = ""
         self.sort_mode = "name"  # name, status, merged, or updated
         self._loading = False
+        # The on-disk cache only warms the first fetch; later refreshes (e.g.
+        # after a delete) must not bring back branches that are gone
+        self._cache_shown = False
+        self._flush_timer = None  # Pending rate-limited table rebuild
+        self._render_dirty = False  # Branch data changed since the last rebuild
+        self._streaming = False  # A fetch is streaming branch updates
+        # Branches last updated by a report of the running fetch, whose
+        # reported changes are relative to what is shown
+        self._fetch_reported: Set[str] = set()
+        self._filter_timer = None  # Pending debounced filter application
+        # Rows currently shown in the table, in display order, with their cells
+        self._displayed_keys: List[str] = []
+        self._displayed_rows: Dict[str, RowCells] = {}
+        # Bumped whenever branches_data changes, so redraws can be skipped
+        self._branches_version = 0
+        self._last_render_signature: Optional[tuple] = None
+        # Branches sorted for a (data version, sort mode), reused across redraws
+        self._sorted_cache: Optional[Tuple[Tuple[int, str], List[BranchInfo]]] = None
+        # (sort key, name) of every branch in ascending order for the sort
+        # mode it was built for, kept sorted as branches stream in
+        self._sort_index: List[Tuple[Any, str]] = []
+        self._sort_index_keys: Dict[str, Any] = {}
+        self._sort_index_mode: Optional[str] = None
+        # Names of branches_data as columns, and a trigram index over them,
+        # extended as new branches arrive
+        self._branch_names: List[str] = []
+        self._names_lower: List[str] = []
+        self._trigrams: TrigramIndex = {}
+        # Bumped on every redraw so stale background renders can be dropped
+        self._render_generation = 0
+        self._applied_generation = 0
+
+    def _post_to_ui(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Run a callback on the UI thread without waiting for it (thread-safe)."""
+        self.post_message(UICall(callback, *args))
+
+    @on(UICall)
+    def _run_ui_call(self, message: UICall) -> None:
+        """Run a call posted by ``_post_to_ui``."""
+        message.callback(*message.args)
 
     def _progress_status_update(self, message: str) -> None:
         """Update status bar with progress message (for use in threads)."""
@@ -188,10 +465,17 @@ class BranchManagerApp(App):
 
     def on_mount(self) -> None:
         """Set up the application on mount."""
+        # Resolve widgets once; these are used on every keystroke and redraw
+        self._table = self.query_one("#branch-table", DataTable)
+        self._status = self.query_one("#status-bar", Static)
+        self._filter_input = self.query_one("#filter-input", Input)
+        self._info = self.query_one("#info-panel", Static)
+
         # Set up the table
-        table = self.query_one("#branch-table", DataTable)
+        table = self._table
         table.cursor_type = "row"
-        table.add_columns("Sel", "Branch Name", "Status", "Info", "Last Updated")
+        for label, key in COLUMNS:
+            table.add_column(label, key=key)
 
         # Focus the table by default
         table.focus()
@@ -199,6 +483,10 @@ class BranchManagerApp(App):
         # Start initial auth check and fetch in background
         self.check_auth_and_refresh()
 
+    def on_unmount(self) -> None:
+        """Close the connection kept alive for direct API requests."""
+        self.gh_manager.close()
+
     @work(exclusive=True, thread=True)
     def check_auth_and_refresh(self) -> None:
         """Check authentication and refresh in a background thread."""
@@ -223,6 +511,10 @@ class BranchManagerApp(App):
         # Clear existing data
         self.branches_data = []
         self.branches_dict = {}
+        self._fetch_reported = set()
+        self._branches_version += 1
+        self._sort_index_mode = None
+        self._rebuild_name_columns()
         # self.selected_branches.clear()
 
         # Start the background fetch
@@ -232,6 +524,7 @@ class BranchManagerApp(App):
     def fetch_branches_background(self) -> None:
         """Fetch branches in a background thread."""
         self._loading = True
+        self._streaming = True
         self.call_from_thread(
             self.update_status, "🔄 Fetching repository information..."
         )
@@ -242,49 +535,200 @@ class BranchManagerApp(App):
 
             # Update info panel on main thread
             info_text = f"📁 Repository: [bold]{repo_full}[/bold]  |  🌿 Default: [bold]{default_branch}[/bold]"
-            self.call_from_thread(
-                lambda: self.query_one("#info-panel", Static).update(info_text)
-            )
+            self.call_from_thread(lambda: self._info.update(info_text))
+
+            # Show cached branches right away while they are revalidated
+            if not self._cache_shown:
+                self._cache_shown = True
+                cached = cache.load_branches(repo_full)
+                if cached:
+                    self.call_from_thread(
+                        self._handle_branch_updates, [(b, None) for b in cached]
+                    )
+                    self.call_from_thread(
+                        self.update_status,
+                        f"🔄 Showing {len(cached)} cached branches, refreshing...",
+                    )
+
+            # Branch updates are batched before crossing to the UI thread, so a
+            # burst of updates costs one wakeup instead of one per branch. The
+            # callbacks run on the fetch's event loop, so they post to the UI
+            # rather than wait for it, which would stall requests in flight.
+            # Everything after is posted too, so it runs after the updates.
+            pending: List[Tuple[BranchInfo, Optional[Set[str]]]] = []
+            last_flush = time.monotonic()
+
+            def flush_pending():
+                nonlocal last_flush
+                if pending:
+                    self._post_to_ui(self._handle_branch_updates, list(pending))
+                    pending.clear()
+                last_flush = time.monotonic()
 
             # Define progress callback
             def progress_callback(stage: str, message: str):
-                self.call_from_thread(self._progress_status_update, message)
+                # A new stage may take a while; show what we have so far
+                flush_pending()
+                self._post_to_ui(self._progress_status_update, message)
 
             # Define incremental callback to update UI as branches are fetched
-            def incremental_callback(branch_info: BranchInfo):
-                self.call_from_thread(self._handle_branch_update, branch_info)
+            def incremental_callback(
+                branch_info: BranchInfo, changed_fields: Optional[Set[str]] = None
+            ):
+                pending.append((branch_info, changed_fields))
+                if (
+                    len(pending) >= self.UPDATE_BATCH_SIZE
+                    or time.monotonic() - last_flush > self.UPDATE_BATCH_INTERVAL
+                ):
+                    flush_pending()
 
             # Fetch branches with progress and incremental updates
-            branches = self.gh_manager.fetch_branches(
-                progress_callback=progress_callback,
-                incremental_callback=incremental_callback,
-            )
+            try:
+                # Auto-select needs the compare status of merged branches too
+                branches = self.gh_manager.fetch_branches(
+                    progress_callback=progress_callback,
+                    incremental_callback=incremental_callback,
+                    full_status=True,
+                )
+            finally:
+                flush_pending()
+
+            # Drop branches that no longer exist (e.g. shown from the cache).
+            # An empty result means listing failed; keep what is shown.
+            if branches:
+                self._post_to_ui(self._handle_fetch_complete, branches)
+                cache.save_branches(repo_full, branches)
 
             # Final status update
-            self.call_from_thread(
-                self.update_status, f"✅ Loaded {len(branches)} branches"
-            )
+            self._post_to_ui(self.update_status, f"✅ Loaded {len(branches)} branches")
 
         except Exception as e:
-            self.call_from_thread(self.update_status, f"❌ Error: {str(e)}", error=True)
+            self._post_to_ui(self.update_status, f"❌ Error: {str(e)}", True)
         finally:
             self._loading = False
+            # Stop rate limiting redraws only once the posted updates are in
+            self._post_to_ui(self._finish_streaming)
+
+    def _finish_streaming(self) -> None:
+        """Leave streaming mode after a fetch, redrawing anything pending."""
+        self._streaming = False
+        if self._render_dirty:
+            self._flush_pending()
+
+    def _handle_branch_updates(
+        self, updates: List[Tuple[BranchInfo, Optional[Set[str]]]]
+    ) -> None:
+        """Handle a batch of (branch, changed fields) updates from background thread."""
+        with self.batch_update():
+            for branch_info, changed_fields in updates:
+                self._handle_branch_update(branch_info, changed_fields)
+
+    def _handle_branch_update(
+        self, branch_info: BranchInfo, changed_fields: Optional[Set[str]] = None
+    ) -> None:
+        """Handle a single branch update from background thread.
+
+        Args:
+            branch_info: The new or updated branch
+            changed_fields: Fields changed since the branch was last reported,
+                            or None if unknown
+        """
+        reported = changed_fields is not None
 
-    def _handle_branch_update(self, branch_info: BranchInfo) -> None:
-        """Handle a single branch update from background thread."""
         # Use dictionary for O(1) lookup instead of linear search
         if branch_info.name in self.branches_dict:
             # Update existing branch
             idx = self.branches_dict[branch_info.name]
+
+            # Keep showing known (e.g. cached) data until the refetch resolves
+            # it, rather than flashing back to a placeholder
+            if (
+                branch_info.status == "fetching"
+                and self.branches_data[idx].status != "fetching"
+            ):
+                return
+
+            # Changes are relative to this fetch's last report of the branch,
+            # not to data shown before it (e.g. from the cache)
+            if branch_info.name not in self._fetch_reported:
+                changed_fields = None
+            if reported:
+                self._fetch_reported.add(branch_info.name)
             self.branches_data[idx] = branch_info
+            self._branches_version += 1
+            self._index_branch(branch_info)
+
+            # Patch the visible row in place instead of rebuilding the table
+            table = self._table
+            if branch_info.name in self._displayed_rows:
+                self._patch_row(
+                    table,
+                    branch_info.name,
+                    self._row_cells(branch_info, self.selected_branches),
+                )
+
+                # Re-sort only if the field ordered by changed; the row patch
+                # above already redraws just the cells that differ
+                sort_field = SORT_FIELDS[self.sort_mode]
+                if sort_field is not None and (
+                    changed_fields is None or sort_field in changed_fields
+                ):
+                    self._schedule_flush()
+                return
         else:
             # Add new branch
             idx = len(self.branches_data)
             self.branches_data.append(branch_info)
             self.branches_dict[branch_info.name] = idx
+            self._branch_names.append(branch_info.name)
+            self._names_lower.append(branch_info.name_lower)
+            _add_trigrams(self._trigrams, idx, branch_info.name_lower)
+            if reported:
+                self._fetch_reported.add(branch_info.name)
+            self._branches_version += 1
+            self._index_branch(branch_info)
+
+        # New or hidden rows need a rebuild to land in sorted order; coalesce
+        # streaming bursts so they redraw once
+        self._schedule_flush()
+
+    def _handle_fetch_complete(self, branches: List[BranchInfo]) -> None:
+        """Drop branches that are not part of a completed fetch."""
+        fetched = {branch.name for branch in branches}
+        if len(fetched) == len(self.branches_data):
+            return
+
+        self.branches_data = [b for b in self.branches_data if b.name in fetched]
+        self.branches_dict = {b.name: idx for idx, b in enumerate(self.branches_data)}
+        self.selected_branches &= fetched
+        self._branches_version += 1
+        self._sort_index_mode = None
+        self._rebuild_name_columns()
+        self._update_table(preserve_cursor=True)
+
+    def _schedule_flush(self) -> None:
+        """Schedule a table rebuild.
 
-        # Update table display
-        self._update_table()
+        While a fetch is streaming, rebuilds are rate limited to one per
+        ``STREAM_RENDER_INTERVAL`` regardless of how fast branches arrive;
+        otherwise the table is rebuilt right away.
+        """
+        self._render_dirty = True
+        if not self._streaming:
+            self._flush_pending()
+        elif self._flush_timer is None:
+            self._flush_timer = self.set_timer(
+                self.STREAM_RENDER_INTERVAL, self._flush_pending
+            )
+
+    def _flush_pending(self) -> None:
+        """Rebuild the table once for all updates received since scheduling."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if self._render_dirty:
+            self._render_dirty = False
+            self._update_table_in_background(preserve_cursor=True)
 
     def _update_table(self, preserve_cursor: bool = False) -> None:
         """Update the data table with current branches.
@@ -292,142 +736,330 @@ class BranchManagerApp(App):
         Args:
             preserve_cursor: If True, attempt to preserve cursor position by branch name
         """
-        table = self.query_one("#branch-table", DataTable)
+        signature = self._render_signature()
+        # Nothing visible changed since the last redraw
+        if signature == self._last_render_signature and not preserve_cursor:
+            return
+        self._last_render_signature = signature
+        self._render_generation += 1
+
+        rows = self._compute_rows(
+            self._sorted_view(),
+            self.filter_text,
+            signature[2],
+            self._name_columns(),
+        )
+        self._apply_rows(rows, preserve_cursor=preserve_cursor)
 
-        # Save current cursor row's branch name if preserving cursor
-        current_branch_name = None
-        if preserve_cursor and table.cursor_row is not None:
-            try:
-                coordinate = table.cursor_coordinate
-                if coordinate is not None:
-                    row_key = table.coordinate_to_cell_key(coordinate).row_key
-                    current_branch_name = (
-                        str(row_key.value)
-                        if hasattr(row_key, "value")
-                        else str(row_key)
-                    )
-            except Exception:
-                pass
+    def _update_table_in_background(self, preserve_cursor: bool = False) -> None:
+        """Update the data table, filtering and sorting off the UI thread.
 
-        table.clear()
+        Used for redraws triggered while typing or streaming so large branch
+        lists don't block input; only the table mutations run on the UI
+        thread.
 
-        # Filter branches based on filter text
-        filtered_branches = [
-            b for b in self.branches_data if self.filter_text.lower() in b.name.lower()
-        ]
-
-        # Sort branches
-        if self.sort_mode == "name":
-            filtered_branches.sort(key=lambda b: b.name)
-        elif self.sort_mode == "status":
-            status_order = {
-                "protected": 0,
-                "diverged": 1,
-                "ahead": 2,
-                "behind": 3,
-                "identical": 4,
-                "fetching": 5,
-                "unknown": 6,
-            }
-            filtered_branches.sort(
-                key=lambda b: (status_order.get(b.status, 7), b.name)
-            )
-        elif self.sort_mode == "merged":
-            filtered_branches.sort(key=lambda b: (not b.is_merged, b.name))
-        elif self.sort_mode == "updated":
-            # Sort by last updated time, most recent first (None values last)
-            filtered_branches.sort(
-                key=lambda b: (b.last_commit_date is None, b.last_commit_date or ""),
-                reverse=True,
-            )
+        Args:
+            preserve_cursor: If True, attempt to preserve cursor position by branch name
+        """
+        signature = self._render_signature()
+        if signature == self._last_render_signature and not preserve_cursor:
+            return
+        self._last_render_signature = signature
+        self._render_generation += 1
+
+        # Snapshot the inputs; the worker must not read state the UI mutates.
+        # The sorted view is built (or reused) here on the UI thread and is a
+        # fresh list, and the name columns are a fixed snapshot, so the
+        # worker only filters and formats them.
+        self._compute_rows_background(
+            self._sorted_view(),
+            self.filter_text,
+            signature[2],
+            self._name_columns(),
+            self._branches_version,
+            self._render_generation,
+            preserve_cursor,
+        )
+
+    @work(exclusive=True, thread=True, group="render")
+    def _compute_rows_background(
+        self,
+        branches: List[BranchInfo],
+        filter_text: str,
+        selected: FrozenSet[str],
+        columns: NameColumns,
+        version: int,
+        generation: int,
+        preserve_cursor: bool,
+    ) -> None:
+        """Filter and format rows in a background thread."""
+        rows = self._compute_rows(branches, filter_text, selected, columns)
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(
+            self._apply_rows,
+            rows,
+            preserve_cursor=preserve_cursor,
+            generation=generation,
+            version=version,
+        )
 
-        target_row_idx = None
-        for idx, branch in enumerate(filtered_branches):
-            # Selection indicator
-            sel = "✓" if branch.name in self.selected_branches else " "
+    def _index_branch(self, branch: BranchInfo) -> None:
+        """Move a new or changed branch to its place in the sort index."""
+        # A stale index is rebuilt on the next redraw instead
+        if self._sort_index_mode != self.sort_mode:
+            return
 
-            # Branch name
-            name = branch.name
+        key = _sort_index_key(self.sort_mode)(branch)
+        name = branch.name
+        index = self._sort_index
+        if name in self._sort_index_keys:
+            old_key = self._sort_index_keys[name]
+            if old_key == key:
+                return
+            del index[bisect_left(index, (old_key, name))]
+        insort(index, (key, name))
+        self._sort_index_keys[name] = key
+
+    def _rebuild_sort_index(self) -> None:
+        """Sort all branches for the current sort mode."""
+        key_func = _sort_index_key(self.sort_mode)
+        self._sort_index_keys = {b.name: key_func(b) for b in self.branches_data}
+        self._sort_index = sorted(
+            (key, name) for name, key in self._sort_index_keys.items()
+        )
+        self._sort_index_mode = self.sort_mode
 
-            # Status with color and ahead/behind info
-            status_text = self._format_status(branch)
+    def _sorted_view(self) -> List[BranchInfo]:
+        """Get the branches in display order for the current sort mode.
+
+        Reads the incrementally maintained sort index, so no comparisons
+        are needed unless the sort mode changed.
+        """
+        cache_key = (self._branches_version, self.sort_mode)
+        cached = self._sorted_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        if self._sort_index_mode != self.sort_mode:
+            self._rebuild_sort_index()
+        data, positions = self.branches_data, self.branches_dict
+        view = [data[positions[name]] for _, name in self._sort_index]
+        self._sorted_cache = (cache_key, view)
+        return view
+
+    def _rebuild_name_columns(self) -> None:
+        """Rebuild the name columns after branches were dropped.
+
+        Builds new lists rather than editing them, as workers may still be
+        reading the old ones.
+        """
+        columns = NameColumns.of(self.branches_data)
+        self._branch_names = columns.names
+        self._names_lower = columns.names_lower
+        self._trigrams = columns.trigrams
+
+    def _name_columns(self) -> NameColumns:
+        """Snapshot the name columns for filtering."""
+        return NameColumns(
+            self._branch_names,
+            self._names_lower,
+            self._trigrams,
+            len(self._branch_names),
+        )
 
-            # Additional info
-            info_parts = []
+    def _render_signature(self) -> tuple:
+        """Summarize everything that affects what the table shows."""
+        return (
+            self.filter_text,
+            self.sort_mode,
+            frozenset(self.selected_branches),
+            self._branches_version,
+        )
 
-            # Show merge status
-            if branch.merge_status == MergeStatus.MERGED:
-                info_parts.append("merged")
-            elif branch.merge_status == MergeStatus.FETCHING:
-                info_parts.append("merge:fetching")
+    def _compute_rows(
+        self,
+        branches: List[BranchInfo],
+        filter_text: str,
+        selected: AbstractSet[str],
+        columns: Optional[NameColumns] = None,
+    ) -> List[RowCells]:
+        """Filter and format branches, already in display order, into table rows.
 
-            # Show PR status
-            if branch.pr_status == PRStatus.CLOSED:
-                info_parts.append("PR closed")
-            elif branch.pr_status == PRStatus.FETCHING:
-                info_parts.append("PR:fetching")
+        Only reads its arguments, so it is safe to run in a worker on a
+        snapshot of the sorted view.
 
-            if branch.is_protected:
-                info_parts.append("protected")
-            if branch.is_default:
-                info_parts.append("default")
+        Args:
+            branches: Branches to show in order (the app passes its sorted view)
+            filter_text: Case-insensitive substring to filter branch names by
+            selected: Names of the selected branches
+            columns: Name columns of the branches, built from ``branches`` if
+                     not given
+        """
+        # Filtering keeps the order, so typing in the filter never re-sorts
+        filtered_branches = branches
 
-            info = ", ".join(info_parts) if info_parts else ""
+        # Filter branches based on filter text
+        needle = filter_text.lower()
+        if needle:
+            if columns is None:
+                columns = NameColumns.of(branches)
+            names, names_lower = columns.names, columns.names_lower
+            if len(needle) >= 3:
+                # Narrow down to names sharing every trigram of the filter,
+                # and only substring-check those
+                candidates: Iterable[int] = _trigram_candidates(
+                    columns.trigrams, needle
+                )
+            else:
+                candidates = range(columns.count)
+            matched = {
+                names[i]
+                for i in candidates
+                if i < columns.count and needle in names_lower[i]
+            }
+            # Map the matches onto the display order
+            filtered_branches = [b for b in branches if b.name in matched]
 
-            # Format last updated time
-            last_updated = self._format_timestamp(branch.last_commit_date)
+        return [self._row_cells(branch, selected) for branch in filtered_branches]
 
-            # Add row
-            row_key = table.add_row(
-                sel, name, status_text, info, last_updated, key=branch.name
-            )
+    def _apply_rows(
+        self,
+        rows: List[RowCells],
+        preserve_cursor: bool = False,
+        generation: Optional[int] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        """Show precomputed rows in the table.
 
-            # Track the row index for the current branch
-            if current_branch_name and branch.name == current_branch_name:
-                target_row_idx = idx
+        Args:
+            rows: Row cells in display order
+            preserve_cursor: If True, attempt to preserve cursor position by branch name
+            generation: Render generation the rows were computed for; stale
+                results from a background worker are dropped
+            version: Data version the rows were computed from; if branches
+                changed since, the rows may undo patches made meanwhile, so
+                another redraw is scheduled
+        """
+        if generation is not None and generation != self._render_generation:
+            return
+        self._applied_generation = self._render_generation
 
-        # Restore cursor position if we found the branch
-        if preserve_cursor and target_row_idx is not None and table.row_count > 0:
-            try:
-                table.move_cursor(row=target_row_idx)
-            except Exception:
-                pass
+        table = self._table
+
+        # Save current cursor row's branch name if preserving cursor
+        current_branch_name = self._cursor_branch_name() if preserve_cursor else None
+
+        # Suppress intermediate repaints while the rows are being mutated
+        with self.batch_update():
+            self._reconcile_rows(table, rows)
+
+            target_row_idx = None
+            if current_branch_name:
+                try:
+                    target_row_idx = self._displayed_keys.index(current_branch_name)
+                except ValueError:
+                    pass
+
+            # Restore cursor position if we found the branch
+            if preserve_cursor and target_row_idx is not None and table.row_count > 0:
+                try:
+                    table.move_cursor(row=target_row_idx)
+                except Exception:
+                    pass
+
+        if version is not None and version != self._branches_version:
+            self._schedule_flush()
 
         # Update status with filter info
         if self.filter_text:
             self.update_status(
-                f"🔍 Filtered: {len(filtered_branches)}/{len(self.branches_data)} branches | Sort: {self.sort_mode}"
+                f"🔍 Filtered: {len(rows)}/{len(self.branches_data)} branches | Sort: {self.sort_mode}"
             )
 
-    def _format_status(self, branch: BranchInfo) -> Text:
-        """Format status with colors and ahead/behind info."""
-        status = branch.status
-
-        # Build status text with ahead/behind info
-        status_str = status
-        if status in ["ahead", "behind", "diverged"]:
-            parts = [status]
-            if branch.ahead_by is not None and branch.ahead_by > 0:
-                parts.append(f"↑{branch.ahead_by}")
-            if branch.behind_by is not None and branch.behind_by > 0:
-                parts.append(f"↓{branch.behind_by}")
-            status_str = " ".join(parts)
-
-        # Apply colors
-        if status == "identical":
-            return Text(status_str, style="blue")
-        elif status == "behind":
-            return Text(status_str, style="green")
-        elif status == "ahead":
-            return Text(status_str, style="yellow")
-        elif status == "diverged":
-            return Text(status_str, style="red")
-        elif status == "protected":
-            return Text(status_str, style="bold yellow")
-        elif status == "fetching":
-            return Text(status_str, style="dim italic")
-        else:
-            return Text(status_str, style="dim")
+    def _cursor_branch_name(self) -> Optional[str]:
+        """Name of the branch under the table cursor, if any."""
+        row = self._table.cursor_row
+        if row is None or not 0 <= row < len(self._displayed_keys):
+            return None
+        return self._displayed_keys[row]
+
+    def _reconcile_rows(self, table: DataTable, rows: List[RowCells]) -> None:
+        """Bring the table rows in line with ``rows``, touching only what changed.
+
+        Rows that are no longer wanted are removed, new ones are appended,
+        existing ones only get their changed cells updated, and the table is
+        re-sorted only when the resulting order differs.
+        """
+        # The branch name column doubles as the row key
+        order = [cells[1] for cells in rows]
+        wanted = set(order)
+        stale = [name for name in self._displayed_keys if name not in wanted]
+
+        # Each remove_row re-indexes the whole table, so when most rows go
+        # away it is cheaper to start over
+        if len(stale) > len(self._displayed_keys) - len(stale):
+            table.clear()
+            self._displayed_keys = []
+            self._displayed_rows = {}
+        elif stale:
+            for name in stale:
+                table.remove_row(name)
+                del self._displayed_rows[name]
+            self._displayed_keys = [
+                name for name in self._displayed_keys if name in self._displayed_rows
+            ]
+
+        for name, cells in zip(order, rows):
+            if name in self._displayed_rows:
+                self._patch_row(table, name, cells)
+            else:
+                table.add_row(*cells, key=name)
+                self._displayed_rows[name] = cells
+                self._displayed_keys.append(name)
+
+        if order != self._displayed_keys:
+            position = {name: idx for idx, name in enumerate(order)}
+            table.sort("name", key=position.__getitem__)
+            self._displayed_keys = order
+
+    def _patch_row(self, table: DataTable, name: str, cells: RowCells) -> None:
+        """Update only the cells of a displayed row whose value changed."""
+        old_cells = self._displayed_rows[name]
+        if cells == old_cells:
+            return
+        for (_, column_key), old, new in zip(COLUMNS, old_cells, cells):
+            if old != new:
+                # Only remeasure when the cell outgrows its column; remeasuring
+                # forces a relayout of the whole table
+                grows = _markup_width(new) > table.columns[column_key].content_width
+                table.update_cell(name, column_key, new, update_width=grows)
+        self._displayed_rows[name] = cells
+
+    def _row_cells(self, branch: BranchInfo, selected: AbstractSet[str]) -> RowCells:
+        """Build the cell values of a table row, in column order."""
+        # Selection indicator
+        sel = "✓" if branch.name in selected else " "
+
+        # Status with color and ahead/behind info
+        status_text = self._status_markup(branch)
+
+        # Additional info
+        info = _info_display(
+            branch.merge_status,
+            branch.pr_status,
+            branch.is_protected,
+            branch.is_default,
+        )
+
+        # Format last updated time
+        last_updated = self._format_timestamp(branch.last_commit_date)
+
+        return sel, branch.name, status_text, info, last_updated
+
+    def _status_markup(self, branch: BranchInfo) -> str:
+        """Format status as markup with colors and ahead/behind info."""
+        return _status_display(branch.status, branch.ahead_by, branch.behind_by)
 
     def _format_timestamp(self, timestamp: Optional[str]) -> str:
         """Format ISO 8601 timestamp to relative or absolute time.
@@ -479,7 +1111,7 @@ class BranchManagerApp(App):
 
     def action_toggle_selection(self) -> None:
         """Toggle selection of the current branch."""
-        table = self.query_one("#branch-table", DataTable)
+        table = self._table
 
         if table.cursor_row is None:
             return
@@ -487,25 +1119,14 @@ class BranchManagerApp(App):
         # Save cursor position
         current_row = table.cursor_row
 
-        # Get the row key which is the branch name
         try:
-            # Get the coordinate of the current cursor position
-            coordinate = table.cursor_coordinate
-            if coordinate is None:
+            branch_name = self._cursor_branch_name()
+            if branch_name is None:
                 return
 
-            # Get the row key for the current row
-            row_key = table.coordinate_to_cell_key(coordinate).row_key
-            branch_name = (
-                str(row_key.value) if hasattr(row_key, "value") else str(row_key)
-            )
-
             # Find the branch in our data
-            branch = None
-            for b in self.branches_data:
-                if b.name == branch_name:
-                    branch = b
-                    break
+            idx = self.branches_dict.get(branch_name)
+            branch = self.branches_data[idx] if idx is not None else None
 
             if not branch:
                 return
@@ -524,7 +1145,7 @@ class BranchManagerApp(App):
                 self.selected_branches.add(branch.name)
 
             # Update table with cursor preservation
-            self._update_table(preserve_cursor=True)
+            self._update_selection({branch.name})
 
             # Move to next row if there is one
             try:
@@ -544,54 +1165,96 @@ class BranchManagerApp(App):
 
     def action_auto_select_merged(self) -> None:
         """Auto-select all merged branches."""
-        count = 0
-        for branch in self.branches_data:
-            # Skip protected and default branches
-            if branch.is_protected or branch.is_default:
-                continue
-
-            # Select if merged and fully incorporated (identical or behind)
-            if branch.is_merged and branch.status in ["identical", "behind"]:
-                self.selected_branches.add(branch.name)
-                count += 1
-
-        self._update_table()
-        self.update_status(f"✅ Auto-selected {count} merged branch(es)")
+        # Select if merged and fully incorporated (identical or behind),
+        # skipping protected and default branches
+        to_add = {
+            branch.name
+            for branch in self.branches_data
+            if branch.is_merged
+            and branch.status in ("identical", "behind")
+            and not (branch.is_protected or branch.is_default)
+        }
+        newly_selected = to_add - self.selected_branches
+        self.selected_branches |= to_add
+
+        self._update_selection(newly_selected)
+        self.update_status(f"✅ Auto-selected {len(to_add)} merged branch(es)")
 
     def action_clear_selection(self) -> None:
         """Clear all selections."""
+        cleared = set(self.selected_branches)
         self.selected_branches.clear()
-        self._update_table()
+        self._update_selection(cleared)
         self.update_status("Cleared selection")
 
+    def _update_selection(self, changed: AbstractSet[str]) -> None:
+        """Redraw after the selection of the ``changed`` branches flipped.
+
+        When nothing but the selection changed since the last redraw, only
+        the Sel cells of the affected rows are patched; otherwise fall back
+        to a full update.
+        """
+        signature = self._render_signature()
+        previous = self._last_render_signature
+        if (
+            previous is None
+            or previous[:2] != signature[:2]
+            or previous[3] != signature[3]
+            # A background render is still in flight and would overwrite us
+            or self._applied_generation != self._render_generation
+        ):
+            self._update_table(preserve_cursor=True)
+            return
+
+        with self.batch_update():
+            for name in changed:
+                cells = self._displayed_rows.get(name)
+                if cells is not None:
+                    sel = "✓" if name in self.selected_branches else " "
+                    self._patch_row(
+                        self._table, name, (sel, cells[1], cells[2], cells[3], cells[4])
+                    )
+        self._last_render_signature = signature
+
     def action_focus_filter(self) -> None:
         """Focus the filter input."""
-        filter_input = self.query_one("#filter-input", Input)
-        filter_input.focus()
+        self._filter_input.focus()
 
     def action_clear_filter(self) -> None:
         """Clear the filter."""
-        filter_input = self.query_one("#filter-input", Input)
-        filter_input.value = ""
+        self._filter_input.value = ""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
         self.filter_text = ""
-        self._update_table()
+        self._update_table_in_background()
         # Return focus to table
-        table = self.query_one("#branch-table", DataTable)
-        table.focus()
+        self._table.focus()
 
     def action_cycle_sort(self) -> None:
         """Cycle through sort modes."""
         sort_modes = ["name", "status", "merged", "updated"]
         current_idx = sort_modes.index(self.sort_mode)
         self.sort_mode = sort_modes[(current_idx + 1) % len(sort_modes)]
-        self._update_table()
+        self._update_table_in_background()
         self.update_status(f"Sort by: {self.sort_mode}")
 
     @on(Input.Changed, "#filter-input")
     def on_filter_changed(self, event: Input.Changed) -> None:
-        """Handle filter text changes."""
-        self.filter_text = event.value
-        self._update_table()
+        """Handle filter text changes.
+
+        Applying the filter is debounced so a burst of keystrokes only
+        rebuilds the table once typing pauses.
+        """
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(0.15, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Apply the current filter input value to the table."""
+        self._filter_timer = None
+        self.filter_text = self._filter_input.value
+        self._update_table_in_background()
 
     def action_delete_selected(self) -> None:
         """Delete selected branches with confirmation."""
@@ -643,7 +1306,7 @@ class BranchManagerApp(App):
 
         def progress_callback(current: int, total: int, branch_name: str):
             self.call_from_thread(
-                self.update_status, f"🗑️  Deleting ({current}/{total}): {branch_name}..."
+                self.update_status, f"🗑️  Deleted ({current}/{total}): {branch_name}..."
             )
 
         results = self.gh_manager.delete_branches(
@@ -668,6 +1331,10 @@ class BranchManagerApp(App):
         failure_count: int,
     ) -> None:
         """Handle deletion completion from background thread."""
+        # The cache still lists deleted branches; the refresh rewrites it
+        if success_count and self.gh_manager.repo_full:
+            cache.invalidate(self.gh_manager.repo_full)
+
         # Clear selection of successfully deleted branches
         for branch_name, success, _ in results:
             if success and branch_name in self.selected_branches:
@@ -687,8 +1354,7 @@ class BranchManagerApp(App):
     def update_status(self, message: str, error: bool = False) -> None:
         """Update the status bar."""
         style = "bold red" if error else "bold green"
-        status_widget = self.query_one("#status-bar", Static)
-        status_widget.update(f"[{style}]{message}[/{style}]")
+        self._status.update(f"[{style}]{message}[/{style}]")
 
 
 def main():
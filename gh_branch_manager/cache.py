@@ -0,0 +1,84 @@
+"""On-disk cache of fetched branches, used to warm the TUI on startup."""
+
+import json
+import os
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import List, Optional
+
+from .github_api import BranchInfo, MergeStatus, PRStatus
+
+# Cached branches older than this (in seconds) are not shown
+CACHE_MAX_AGE = 60 * 60
+
+# BranchInfo fields that are passed to its constructor
+_INIT_FIELDS = tuple(f.name for f in fields(BranchInfo) if f.init)
+
+
+def cache_dir() -> Path:
+    """Get the directory holding the branch caches."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(base).expanduser() / "gh-branch-manager"
+
+
+def cache_path(repo_full: str) -> Path:
+    """Get the cache file for a repository (``owner/name``)."""
+    return cache_dir() / f"{repo_full}.json"
+
+
+def load_branches(
+    repo_full: str, max_age: float = CACHE_MAX_AGE
+) -> Optional[List[BranchInfo]]:
+    """Load cached branches for a repository.
+
+    Returns:
+        List of cached branches, or None if there is no usable cache
+    """
+    try:
+        with open(cache_path(repo_full), encoding="utf-8") as f:
+            data = json.load(f)
+        if time.time() - data["saved_at"] > max_age:
+            return None
+        return [
+            BranchInfo(
+                **{
+                    **{key: entry[key] for key in _INIT_FIELDS if key in entry},
+                    "merge_status": MergeStatus(entry["merge_status"]),
+                    "pr_status": PRStatus(entry["pr_status"]),
+                }
+            )
+            for entry in data["branches"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, unreadable or outdated cache
+        return None
+
+
+def save_branches(repo_full: str, branches: List[BranchInfo]) -> None:
+    """Save branches for a repository, ignoring failures."""
+    entries = []
+    for branch in branches:
+        entry = {key: getattr(branch, key) for key in _INIT_FIELDS}
+        entry["merge_status"] = branch.merge_status.value
+        entry["pr_status"] = branch.pr_status.value
+        entries.append(entry)
+
+    path = cache_path(repo_full)
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "branches": entries}, f)
+        # Replace atomically so a concurrent reader never sees a partial file
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def invalidate(repo_full: str) -> None:
+    """Remove the cached branches of a repository, ignoring failures."""
+    try:
+        cache_path(repo_full).unlink()
+    except OSError:
+        pass
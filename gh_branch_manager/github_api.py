@@ -1,11 +1,107 @@
 """GitHub API wrapper for branch operations using gh CLI."""
 
+import asyncio
+import copy
+import importlib.util
+import inspect
 import json
+import re
 import subprocess
+import sys
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+try:
+    # Optional: parses gh's JSON output straight from bytes, and faster
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: talks to the GitHub API directly over one kept-alive
+    # connection instead of starting gh for every request
+    import httpx
+except ImportError:
+    httpx = None
+
+# Parse JSON from bytes (or str)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# httpx speaks HTTP/2 only if h2 is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+# BranchInfo fields filled in by a fetch, reported to update callbacks when
+# they change
+_UPDATE_FIELDS = (
+    "status",
+    "merge_status",
+    "pr_status",
+    "is_protected",
+    "is_default",
+    "ahead_by",
+    "behind_by",
+    "last_commit_date",
+)
+_update_values = attrgetter(*_UPDATE_FIELDS)
+
+
+def _takes_changed_fields(callback: Callable[..., Any]) -> bool:
+    """Check if an update callback takes the changed fields as a second argument."""
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+    return positional >= 2
+
+
+async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Run a blocking iterator in a worker thread, yielding items as they arrive."""
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+    done = object()
+
+    def pump() -> None:
+        try:
+            for item in iterator:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    pumping = loop.run_in_executor(None, pump)
+    while True:
+        item = await queue.get()
+        if item is done:
+            break
+        yield item
+    # Re-raise an error from the iterator
+    await pumping
 
 
 class MergeStatus(Enum):
@@ -26,7 +122,7 @@ class PRStatus(Enum):
     FETCHING = "fetching"
 
 
-@dataclass
+@dataclass(slots=True)
 class BranchInfo:
     """Information about a GitHub branch."""
 
@@ -39,6 +135,11 @@ class BranchInfo:
     ahead_by: Optional[int] = None
     behind_by: Optional[int] = None
     last_commit_date: Optional[str] = None  # ISO 8601 timestamp
+    # Lowercased name, cached for case-insensitive filtering
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
 
     # Legacy properties for backward compatibility
     @property
@@ -56,39 +157,115 @@ class GitHubBranchManager:
     """Manages GitHub branch operations using gh CLI."""
 
     DEFAULT_PROTECTED_REGEX = r"^(main|master|staging|dev|develop)$"
+    # The names DEFAULT_PROTECTED_REGEX matches, checked without a regex
+    _PROTECTED_NAMES: FrozenSet[str] = frozenset(
+        {"main", "master", "staging", "dev", "develop"}
+    )
+
+    # GitHub API used by direct (gh-less) requests for github.com
+    # repositories; other hosts are reached through their own API
+    API_URL = "https://api.github.com"
+
+    # Seconds to reuse the repository name and default branch for
+    REPO_INFO_TTL = 10 * 60
 
-    def __init__(self):
-        """Initialize the branch manager."""
+    # Seconds the branch listing may take before it is abandoned
+    LIST_TIMEOUT = 30
+
+    # Branches whose status and commit date are fetched per GraphQL request.
+    # Larger queries save round trips but get disproportionately slower, so
+    # batches of this size are fetched concurrently instead.
+    BATCH_SIZE = 50
+
+    def __init__(self, max_concurrency: int = 32):
+        """Initialize the branch manager.
+
+        Args:
+            max_concurrency: Maximum number of gh calls or API requests to run
+                             at once
+        """
+        self._max_workers = max(1, max_concurrency)
+        self._auth_checked: Optional[bool] = None
+        # gh's token and the client for direct API requests, fetched and
+        # created on first use
+        self._token: Optional[str] = None
+        self._http: Optional["httpx.Client"] = None
+        self._http_unavailable = httpx is None
+        # url -> (ETag, parsed page, next page URL) of direct REST listings,
+        # revalidated with conditional requests
+        self._etag_cache: Dict[str, Tuple[str, Any, Optional[str]]] = {}
         self.repo_full: Optional[str] = None
         self.default_branch: Optional[str] = None
+        # Host of the repository (e.g. github.com), which gh's token and
+        # direct requests are for
+        self.host: Optional[str] = None
+        self._repo_info_cached_at: Optional[float] = None
         self.branches: List[BranchInfo] = []
+        # A pattern overridden by a subclass is matched as a regex instead
+        self._protected_re = (
+            None
+            if self.DEFAULT_PROTECTED_REGEX
+            == GitHubBranchManager.DEFAULT_PROTECTED_REGEX
+            else re.compile(self.DEFAULT_PROTECTED_REGEX)
+        )
         self._merged_branches: Set[str] = set()
         self._closed_pr_branches: Set[str] = set()
         self._branch_commits: dict[str, str] = {}  # branch_name -> commit_sha
+        # branch_name -> (status, ahead_by, behind_by)
+        self._compare_statuses: Dict[str, Tuple[str, Optional[int], Optional[int]]] = {}
+        self._commit_dates: Dict[str, str] = {}  # branch_name -> ISO 8601 date
+        self._ref_ids: Dict[str, str] = {}  # branch_name -> GraphQL ref node ID
 
     def check_gh_auth(self) -> bool:
-        """Check if gh CLI is authenticated."""
+        """Check if gh CLI is authenticated.
+
+        The result is remembered until ``invalidate_auth_cache`` is called.
+        """
+        if self._auth_checked is not None:
+            return self._auth_checked
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"], capture_output=True, text=True, timeout=5
             )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            self._auth_checked = result.returncode == 0
+        except subprocess.TimeoutExpired:
+            # Don't remember a transient failure
             return False
+        except FileNotFoundError:
+            self._auth_checked = False
+        return self._auth_checked
+
+    def invalidate_auth_cache(self) -> None:
+        """Forget the remembered authentication status (e.g. after logging in)."""
+        self._auth_checked = None
 
     def get_repo_info(self) -> Tuple[str, str]:
-        """Get repository name and default branch."""
+        """Get repository name and default branch.
+
+        Also remembers the host of the repository, for direct API requests.
+
+        The result is reused for ``REPO_INFO_TTL`` seconds, so refreshing
+        does not look the repository up again.
+        """
+        if (
+            self._repo_info_cached_at is not None
+            and time.monotonic() - self._repo_info_cached_at < self.REPO_INFO_TTL
+            and self.repo_full
+            and self.default_branch
+        ):
+            return self.repo_full, self.default_branch
+
         try:
-            # Get repo full name
+            # Get repo full name, default branch and URL in one call
             result = subprocess.run(
                 [
                     "gh",
                     "repo",
                     "view",
                     "--json",
-                    "nameWithOwner",
+                    "nameWithOwner,defaultBranchRef,url",
                     "-q",
-                    ".nameWithOwner",
+                    '.nameWithOwner + "\\n" + .defaultBranchRef.name + "\\n" + .url',
                 ],
                 capture_output=True,
                 text=True,
@@ -96,26 +273,12 @@ class GitHubBranchManager:
             )
             if result.returncode != 0:
                 raise Exception(f"Failed to get repo info: {result.stderr}")
-            self.repo_full = result.stdout.strip()
-
-            # Get default branch
-            result = subprocess.run(
-                [
-                    "gh",
-                    "repo",
-                    "view",
-                    "--json",
-                    "defaultBranchRef",
-                    "-q",
-                    ".defaultBranchRef.name",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                raise Exception(f"Failed to get default branch: {result.stderr}")
-            self.default_branch = result.stdout.strip()
+            lines = result.stdout.strip().split("\n")
+            if len(lines) != 3:
+                raise Exception(f"Unexpected repo info: {result.stdout}")
+            self.repo_full, self.default_branch, url = (line.strip() for line in lines)
+            self._set_host(urlsplit(url).hostname)
+            self._repo_info_cached_at = time.monotonic()
 
             return self.repo_full, self.default_branch
         except subprocess.TimeoutExpired:
@@ -124,133 +287,215 @@ class GitHubBranchManager:
             raise Exception("gh CLI not found. Please install GitHub CLI.")
 
     def fetch_branches(
-        self, progress_callback=None, incremental_callback=None
+        self, progress_callback=None, incremental_callback=None, full_status=False
     ) -> List[BranchInfo]:
         """Fetch all branches with their status.
 
+        Runs ``afetch_branches`` on a new event loop, so it must not be called
+        from a running one.
+
         Args:
             progress_callback: Optional callback function to report progress.
                                Called with (stage, message) strings.
             incremental_callback: Optional callback function for incremental updates.
-                                  Called with (branch_info) after each branch is processed.
+                                  Called with (branch_info, changed_fields) when a
+                                  branch is listed and when its fields change;
+                                  a callback taking one argument gets just
+                                  (branch_info). branch_info is a snapshot, which
+                                  the fetch does not change afterwards.
+            full_status: If True, also compare merged branches against the default
+                         branch. Otherwise their status is just "merged".
+
+        The callbacks run on the fetch's event loop and must not block.
+        """
+        return asyncio.run(
+            self.afetch_branches(progress_callback, incremental_callback, full_status)
+        )
+
+    async def afetch_branches(
+        self, progress_callback=None, incremental_callback=None, full_status=False
+    ) -> List[BranchInfo]:
+        """Fetch all branches with their status, without blocking the event loop.
+
+        Requests go over one async connection when httpx is available;
+        otherwise gh is run in worker threads. The PR listing runs while the
+        branch listing streams in. Takes the same arguments as
+        ``fetch_branches``. The callbacks are called from the event loop, so
+        they must not block: they would stall every request in flight.
         """
         if not self.repo_full or not self.default_branch:
-            self.get_repo_info()
+            await asyncio.to_thread(self.get_repo_info)
+
+        client = await self._async_client()
+        try:
+            return await self._afetch_branches(
+                client, progress_callback, incremental_callback, full_status
+            )
+        finally:
+            if client is not None:
+                await client.aclose()
+
+    async def _afetch_branches(
+        self,
+        client: Optional["httpx.AsyncClient"],
+        progress_callback,
+        incremental_callback,
+        full_status: bool,
+    ) -> List[BranchInfo]:
+        """Run the fetch pipeline of ``afetch_branches`` over ``client``."""
+        if incremental_callback and not _takes_changed_fields(incremental_callback):
+            report_branch = incremental_callback
+
+            def incremental_callback(branch_info, changed_fields):
+                report_branch(branch_info)
+
+        # Field values last reported for each branch
+        reported: Dict[str, tuple] = {}
 
         # Get all remote branches FIRST for immediate display
         if progress_callback:
             progress_callback("branches", "Fetching all remote branches...")
-        branches = self._fetch_all_branches()
 
-        # Immediately display all branches with "fetching" status for merge/PR info
-        if incremental_callback:
-            for branch_name in branches:
-                # Create a placeholder branch info with fetching statuses
+        # Merged and closed (not merged) PR branches are listed meanwhile
+        pr_listing = asyncio.create_task(self._afetch_pr_branches(client))
+
+        # Display each branch with "fetching" status as soon as its page of
+        # the listing arrives. These placeholders are filled in place as data
+        # arrives, so each branch is allocated once.
+        placeholders: Dict[str, BranchInfo] = {}
+        try:
+            async for branch_name in self._afetch_all_branches(client):
                 placeholder = BranchInfo(
                     name=branch_name,
                     status="fetching",
                     merge_status=MergeStatus.FETCHING,
                     pr_status=PRStatus.FETCHING,
                 )
-                incremental_callback(placeholder)
+                placeholders[branch_name] = placeholder
+                if incremental_callback:
+                    self._notify(incremental_callback, placeholder, reported)
+        except BaseException:
+            pr_listing.cancel()
+            raise
 
-        # Now fetch merged PR branches in background
         if progress_callback:
-            progress_callback("merged", "Fetching merged PR branches...")
-        self._fetch_merged_branches()
+            progress_callback("prs", "Fetching merged and closed PR branches...")
+        await pr_listing
 
-        # Update all branches with merge status
-        if incremental_callback:
-            for branch_name in branches:
-                update = BranchInfo(
-                    name=branch_name,
-                    status="fetching",
-                    merge_status=MergeStatus.MERGED
-                    if branch_name in self._merged_branches
-                    else MergeStatus.NOT_MERGED,
-                    pr_status=PRStatus.FETCHING,
-                )
-                incremental_callback(update)
+        # Update all branches with PR status: default to neither, then patch
+        # only the branches in the (bulk-intersected) merged and closed sets.
+        # This is reported along with each branch's details below, so every
+        # branch gets one update for both.
+        for branch_info in placeholders.values():
+            branch_info.merge_status = MergeStatus.NOT_MERGED
+            branch_info.pr_status = PRStatus.NOT_CLOSED
+        for branch_name in self._merged_branches.intersection(placeholders):
+            placeholders[branch_name].merge_status = MergeStatus.MERGED
+        for branch_name in self._closed_pr_branches.intersection(placeholders):
+            placeholders[branch_name].pr_status = PRStatus.CLOSED
 
-        # Get closed (not merged) PR branches
+        # Now fetch compare statuses and commit dates, a batch of branches
+        # per request, showing each batch as soon as it arrives. Batches are
+        # kept small so no single query gets slow, and run concurrently.
         if progress_callback:
-            progress_callback("closed", "Fetching closed PR branches...")
-        self._fetch_closed_pr_branches()
+            progress_callback(
+                "status", f"Fetching status for {len(placeholders)} branches..."
+            )
 
-        # Update all branches with PR status
-        if incremental_callback:
-            for branch_name in branches:
-                update = BranchInfo(
-                    name=branch_name,
-                    status="fetching",
-                    merge_status=MergeStatus.MERGED
-                    if branch_name in self._merged_branches
-                    else MergeStatus.NOT_MERGED,
-                    pr_status=PRStatus.CLOSED
-                    if branch_name in self._closed_pr_branches
-                    else PRStatus.NOT_CLOSED,
+        self._compare_statuses = {}
+        self._commit_dates = {}
+        names = list(placeholders)
+        requests = asyncio.Semaphore(self._max_workers)
+        fetched = 0
+
+        async def fetch_batch(batch: List[str]) -> None:
+            nonlocal fetched
+            async with requests:
+                await self._afetch_branch_details(client, batch, full_status)
+
+            for branch_name in batch:
+                branch_info = placeholders[branch_name]
+                self._fill_branch_info(branch_info, full_status)
+                if incremental_callback:
+                    self._notify(incremental_callback, branch_info, reported)
+
+            fetched += len(batch)
+            if progress_callback:
+                progress_callback(
+                    "status", f"Fetching status... ({fetched}/{len(names)})"
                 )
-                incremental_callback(update)
 
-        # Now update branch statuses using parallel fetching for better performance
-        if progress_callback:
-            progress_callback(
-                "status", f"Fetching status for {len(branches)} branches..."
+        await asyncio.gather(
+            *(
+                fetch_batch(names[start : start + self.BATCH_SIZE])
+                for start in range(0, len(names), self.BATCH_SIZE)
             )
+        )
+
+        self.branches = list(placeholders.values())
+        return self.branches
 
-        self.branches = []
-        completed_count = 0
+    def _notify(
+        self,
+        incremental_callback: Callable[[BranchInfo, Set[str]], Any],
+        branch_info: BranchInfo,
+        reported: Dict[str, tuple],
+    ) -> None:
+        """Report a branch to ``incremental_callback`` if any of its fields changed.
 
-        # Use ThreadPoolExecutor to fetch branch statuses in parallel
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all branch info fetch tasks
-            future_to_branch = {
-                executor.submit(self._get_branch_info, branch_name): branch_name
-                for branch_name in branches
+        Args:
+            incremental_callback: Called with (branch_info, changed_fields)
+            branch_info: The new or updated branch
+            reported: Field values last reported for each branch; a branch
+                      not in it is reported with all fields changed
+        """
+        values = _update_values(branch_info)
+        previous = reported.get(branch_info.name)
+        if previous is None:
+            changed_fields = set(_UPDATE_FIELDS)
+        else:
+            changed_fields = {
+                name
+                for name, old, new in zip(_UPDATE_FIELDS, previous, values)
+                if old != new
             }
+            if not changed_fields:
+                return
+        reported[branch_info.name] = values
+        # The fetch keeps filling branch_info in place, so report a snapshot
+        # that the receiver can read while the fetch goes on
+        incremental_callback(copy.copy(branch_info), changed_fields)
 
-            # Process results as they complete
-            for future in as_completed(future_to_branch):
-                branch_name = future_to_branch[future]
-                try:
-                    branch_info = future.result()
-                    self.branches.append(branch_info)
-                    completed_count += 1
-
-                    # Update progress
-                    if progress_callback and (
-                        completed_count == 1
-                        or completed_count % 5 == 0
-                        or completed_count == len(branches)
-                    ):
-                        progress_callback(
-                            "status",
-                            f"Fetching status... ({completed_count}/{len(branches)})",
-                        )
-
-                    # Call incremental callback to update UI immediately
-                    if incremental_callback:
-                        incremental_callback(branch_info)
-                except Exception as e:
-                    # If a branch fetch fails, create a minimal entry
-                    branch_info = BranchInfo(
-                        name=branch_name,
-                        status="unknown",
-                        merge_status=MergeStatus.MERGED
-                        if branch_name in self._merged_branches
-                        else MergeStatus.NOT_MERGED,
-                        pr_status=PRStatus.CLOSED
-                        if branch_name in self._closed_pr_branches
-                        else PRStatus.NOT_CLOSED,
-                    )
-                    self.branches.append(branch_info)
-                    if incremental_callback:
-                        incremental_callback(branch_info)
+    async def _afetch_pr_branches(self, client: Optional["httpx.AsyncClient"]):
+        """Fetch branches with merged PRs and with closed (not merged) PRs."""
+        # (head branch, state, merged at) of the most recent PRs
+        prs = await self._ahttp_list(
+            client, f"/repos/{self.repo_full}/pulls?state=all&per_page=100", limit=400
+        )
+        if prs is not None:
+            pr_rows = [
+                (pr["head"]["ref"], pr["state"].upper(), pr.get("merged_at") or "")
+                for pr in prs
+            ]
+        else:
+            pr_rows = await asyncio.to_thread(self._fetch_pr_rows_gh)
+            if pr_rows is None:
+                return
 
-        return self.branches
+        # Names are interned like the listed branch names, so matching them
+        # against each other compares identities instead of characters
+        merged_branches = set()
+        closed_pr_branches = set()
+        for name, state, merged_at in pr_rows:
+            if merged_at:
+                merged_branches.add(sys.intern(name))
+            elif state == "CLOSED":
+                closed_pr_branches.add(sys.intern(name))
+        self._merged_branches = merged_branches
+        self._closed_pr_branches = closed_pr_branches
 
-    def _fetch_merged_branches(self):
-        """Fetch branches with merged PRs."""
+    def _fetch_pr_rows_gh(self) -> Optional[List[Tuple[str, str, str]]]:
+        """List (head branch, state, merged at) of recent PRs through gh."""
         try:
             result = subprocess.run(
                 [
@@ -258,192 +503,528 @@ class GitHubBranchManager:
                     "pr",
                     "list",
                     "--state",
-                    "merged",
+                    "all",
                     "--limit",
-                    "200",
+                    "400",
                     "--json",
-                    "headRefName",
+                    "headRefName,state,mergedAt",
                     "--jq",
-                    ".[].headRefName",
+                    ".[] | [.headRefName, .state, .mergedAt] | @tsv",
                 ],
                 capture_output=True,
                 text=True,
                 timeout=30,
             )
-            if result.returncode == 0:
-                self._merged_branches = set(
-                    line.strip()
-                    for line in result.stdout.strip().split("\n")
-                    if line.strip()
-                )
         except subprocess.TimeoutExpired:
-            pass
+            return None
+        if result.returncode != 0:
+            return None
+
+        pr_rows = []
+        for line in result.stdout.split("\n"):
+            parts = line.strip("\r\n").split("\t")
+            if len(parts) == 3 and parts[0]:
+                pr_rows.append((parts[0], parts[1], parts[2]))
+        return pr_rows
 
-    def _fetch_closed_pr_branches(self):
-        """Fetch branches with closed (not merged) PRs."""
+    async def _afetch_all_branches(
+        self, client: Optional["httpx.AsyncClient"]
+    ) -> AsyncIterator[str]:
+        """Fetch all branch names and their commit SHAs.
+
+        Branch names are yielded as the paginated listing streams in, rather
+        than after its last page. They are interned, as each is used as a key
+        of several dicts and sets.
+
+        Raises:
+            Exception: If the listing fails or times out
+        """
+        page = await self._ahttp_get_json(
+            client, f"/repos/{self.repo_full}/branches?per_page=100"
+        )
+        if page is None:
+            async for branch_name in _iterate_in_thread(self._stream_branches_gh()):
+                yield branch_name
+            return
+
+        while True:
+            branches, next_url = page
+            for branch in branches:
+                name = sys.intern(branch["name"])
+                self._branch_commits[name] = branch["commit"]["sha"]
+                yield name
+            if next_url is None:
+                return
+            page = await self._ahttp_get_json(client, next_url)
+            if page is None:
+                raise Exception("Failed to fetch branches")
+
+    def _stream_branches_gh(self) -> Iterator[str]:
+        """Stream branch names and their commit SHAs from ``gh api``."""
+        proc = subprocess.Popen(
+            [
+                "gh",
+                "api",
+                f"repos/{self.repo_full}/branches?per_page=100",
+                "--paginate",
+                "--jq",
+                '.[] | "\\(.name)|\\(.commit.sha)"',
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        # Kill a stalled listing, as the timeout of a blocking call would
+        timer = threading.Timer(self.LIST_TIMEOUT, proc.kill)
+        timer.start()
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "list",
-                    "--state",
-                    "closed",
-                    "--limit",
-                    "200",
-                    "--json",
-                    "headRefName,mergedAt",
-                    "--jq",
-                    ".[] | select(.mergedAt == null) | .headRefName",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            for line in proc.stdout:
+                parts = line.strip().split("|")
+                if len(parts) == 2:
+                    name = sys.intern(parts[0])
+                    self._branch_commits[name] = parts[1]
+                    yield name
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+        if returncode < 0:
+            raise Exception("Timeout while fetching branches")
+        if returncode != 0:
+            raise Exception("Failed to fetch branches")
+
+    def _is_protected(self, branch_name: str) -> bool:
+        """Check if a branch name is protected."""
+        if self._protected_re is None:
+            return branch_name in self._PROTECTED_NAMES
+        return bool(self._protected_re.match(branch_name))
+
+    def _is_protected_or_default(self, branch_name: str) -> bool:
+        """Check if a branch is protected or the default branch."""
+        return self._is_protected(branch_name) or branch_name == self.default_branch
+
+    def _needs_compare(self, branch_name: str, full_status: bool) -> bool:
+        """Check if a branch's status comes from comparing it to the default."""
+        if self._is_protected_or_default(branch_name):
+            return False
+        return full_status or branch_name not in self._merged_branches
+
+    def _fill_branch_info(self, branch_info: BranchInfo, full_status: bool) -> None:
+        """Fill in the status and commit date of a branch from fetched data."""
+        branch_name = branch_info.name
+
+        # Check if protected
+        branch_info.is_protected = self._is_protected(branch_name)
+
+        # Check if default branch
+        branch_info.is_default = branch_name == self.default_branch
+
+        # Get compare status
+        if branch_info.is_protected or branch_info.is_default:
+            branch_info.status = "protected"
+        elif not self._needs_compare(branch_name, full_status):
+            # Only merged branches are left uncompared
+            branch_info.status = "merged"
+        else:
+            branch_info.status, branch_info.ahead_by, branch_info.behind_by = (
+                self._compare_statuses.get(branch_name, ("unknown", None, None))
             )
-            if result.returncode == 0:
-                self._closed_pr_branches = set(
-                    line.strip()
-                    for line in result.stdout.strip().split("\n")
-                    if line.strip()
+
+        # Get commit date
+        branch_info.last_commit_date = self._commit_dates.get(branch_name)
+
+    async def _afetch_branch_details(
+        self,
+        client: Optional["httpx.AsyncClient"],
+        branches: List[str],
+        full_status: bool,
+    ) -> None:
+        """Fetch compare statuses and commit dates for a batch of branches.
+
+        Makes a single GraphQL request with aliased fields per branch: a
+        ``compare`` against the default branch (skipped for protected
+        branches, and for merged ones unless ``full_status``) and the date of
+        the branch's head commit. Results are stored in ``_compare_statuses``
+        and ``_commit_dates``; branches that could not be resolved are left
+        out.
+        """
+        compared = [
+            i
+            for i, branch_name in enumerate(branches)
+            if self._needs_compare(branch_name, full_status)
+        ]
+
+        # Branch names are passed as variables, so they need no escaping
+        variables = {
+            f"h{i}": f"refs/heads/{branch_name}"
+            for i, branch_name in enumerate(branches)
+        }
+        fields = " ".join(
+            f"d{i}: ref(qualifiedName: $h{i}) "
+            "{ id target { ... on Commit { committedDate } } }"
+            for i in range(len(branches))
+        )
+        if compared:
+            variables["base"] = f"refs/heads/{self.default_branch}"
+            compare_fields = " ".join(
+                f"b{i}: compare(headRef: $h{i}) {{ aheadBy behindBy status }}"
+                for i in compared
+            )
+            fields += f" base: ref(qualifiedName: $base) {{ {compare_fields} }}"
+
+        query, variables = self._repository_query(fields, variables)
+        payload = (await self._agraphql(client, query, variables))[0]
+        # A failed field only nulls its own alias, so read whatever data came
+        # back even if the request reported errors
+        repository = (payload.get("data") or {}).get("repository") or {}
+
+        base = repository.get("base") or {}
+        for i, branch_name in enumerate(branches):
+            comparison = base.get(f"b{i}")
+            if comparison:
+                self._compare_statuses[branch_name] = (
+                    comparison["status"].lower(),
+                    comparison.get("aheadBy"),
+                    comparison.get("behindBy"),
                 )
-        except subprocess.TimeoutExpired:
-            pass
+            ref = repository.get(f"d{i}") or {}
+            if ref.get("id"):
+                self._ref_ids[branch_name] = ref["id"]
+            target = ref.get("target") or {}
+            if target.get("committedDate"):
+                self._commit_dates[branch_name] = target["committedDate"]
 
-    def _fetch_all_branches(self) -> List[str]:
-        """Fetch all branch names and their commit SHAs."""
-        try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{self.repo_full}/branches?per_page=100",
-                    "--paginate",
-                    "--jq",
-                    '.[] | "\(.name)|\(.commit.sha)"',
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
+    def _fetch_ref_ids(self, branches: List[str]) -> Dict[str, str]:
+        """Get the GraphQL node IDs of branch refs.
+
+        IDs fetched along with the branch details are reused; the rest are
+        looked up in batches.
+
+        Returns:
+            Dict mapping branch name to ref ID; missing branches are left out
+        """
+        missing = [b for b in dict.fromkeys(branches) if b not in self._ref_ids]
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            batch = missing[start : start + self.BATCH_SIZE]
+            variables = {
+                f"h{i}": f"refs/heads/{branch_name}"
+                for i, branch_name in enumerate(batch)
+            }
+            fields = " ".join(
+                f"r{i}: ref(qualifiedName: $h{i}) {{ id }}" for i in range(len(batch))
             )
-            if result.returncode == 0:
-                branch_names = []
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        parts = line.strip().split("|")
-                        if len(parts) == 2:
-                            name, sha = parts
-                            branch_names.append(name)
-                            self._branch_commits[name] = sha
-                return branch_names
-            return []
-        except subprocess.TimeoutExpired:
-            return []
+            payload = self._graphql_repository(fields, variables)
+            repository = (payload.get("data") or {}).get("repository") or {}
+            for i, branch_name in enumerate(batch):
+                ref = repository.get(f"r{i}") or {}
+                if ref.get("id"):
+                    self._ref_ids[branch_name] = ref["id"]
 
-    def _get_branch_info(self, branch_name: str) -> BranchInfo:
-        """Get detailed information about a branch."""
-        import re
+        return {b: self._ref_ids[b] for b in branches if b in self._ref_ids}
 
-        # Check if protected
-        is_protected = bool(re.match(self.DEFAULT_PROTECTED_REGEX, branch_name))
+    def _repository_query(
+        self, fields: str, variables: Dict[str, str]
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build a GraphQL query for ``fields`` of the current repository.
 
-        # Check if default branch
-        is_default = branch_name == self.default_branch
+        Args:
+            fields: Selection set inside ``repository``, using ``variables``
+            variables: String variables used by ``fields``
 
-        # Determine merge and PR status using enums
-        merge_status = (
-            MergeStatus.MERGED
-            if branch_name in self._merged_branches
-            else MergeStatus.NOT_MERGED
+        Returns:
+            Tuple of (query, all of its variables)
+        """
+        owner, _, name = (self.repo_full or "").partition("/")
+        declarations = "".join(f", ${key}: String!" for key in variables)
+        query = (
+            f"query($owner: String!, $name: String!{declarations}) "
+            f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
         )
-        pr_status = (
-            PRStatus.CLOSED
-            if branch_name in self._closed_pr_branches
-            else PRStatus.NOT_CLOSED
+        return query, {"owner": owner, "name": name, **variables}
+
+    def _graphql_repository(self, fields: str, variables: Dict[str, str]) -> dict:
+        """Run a GraphQL query for ``fields`` of the current repository.
+
+        Returns:
+            The response payload, or an empty dict if the request failed
+        """
+        return self._graphql(*self._repository_query(fields, variables))[0]
+
+    def _graphql(self, query: str, variables: Dict[str, str]) -> Tuple[dict, str]:
+        """Run a GraphQL request directly, or through gh.
+
+        Returns:
+            Tuple of (response payload, error output); the payload is empty if
+            no response could be read
+        """
+        response = self._http_request(
+            "POST", self._graphql_url(), json={"query": query, "variables": variables}
         )
+        result = self._graphql_payload(response) if response is not None else None
+        if result is not None:
+            return result
+        return self._graphql_gh(query, variables)
 
-        # Get compare status
-        status = "unknown"
-        ahead_by = None
-        behind_by = None
-        if is_protected or is_default:
-            status = "protected"
-        else:
-            status, ahead_by, behind_by = self._get_compare_status(branch_name)
+    async def _agraphql(
+        self,
+        client: Optional["httpx.AsyncClient"],
+        query: str,
+        variables: Dict[str, str],
+    ) -> Tuple[dict, str]:
+        """Run a GraphQL request over ``client``, or through gh in a thread.
 
-        # Get commit date
-        last_commit_date = self._get_commit_date(branch_name)
-
-        return BranchInfo(
-            name=branch_name,
-            status=status,
-            merge_status=merge_status,
-            pr_status=pr_status,
-            is_protected=is_protected,
-            is_default=is_default,
-            ahead_by=ahead_by,
-            behind_by=behind_by,
-            last_commit_date=last_commit_date,
+        Returns:
+            Tuple of (response payload, error output), as ``_graphql``
+        """
+        response = await self._ahttp_request(
+            client,
+            "POST",
+            self._graphql_url(),
+            json={"query": query, "variables": variables},
         )
+        result = self._graphql_payload(response) if response is not None else None
+        if result is not None:
+            return result
+        return await asyncio.to_thread(self._graphql_gh, query, variables)
+
+    @staticmethod
+    def _graphql_payload(response: "httpx.Response") -> Optional[Tuple[dict, str]]:
+        """Read a direct GraphQL response as (payload, error output).
+
+        Returns None if the repository could not be read (e.g. the token
+        can't see it), so the request is retried through gh.
+        """
+        try:
+            payload = _json_loads(response.content)
+        except ValueError:
+            return {}, response.text
+        if not isinstance(payload, dict):
+            return {}, response.text
+        data = payload.get("data")
+        if (
+            isinstance(data, dict)
+            and "repository" in data
+            and data["repository"] is None
+        ):
+            return None
+        return payload, "" if "data" in payload else response.text
+
+    def _graphql_gh(self, query: str, variables: Dict[str, str]) -> Tuple[dict, str]:
+        """Run a GraphQL request through gh."""
+        args = ["gh", "api", "graphql", "-f", f"query={query}"]
+        for key, value in variables.items():
+            args += ["-f", f"{key}={value}"]
+
+        try:
+            # Keep stdout as bytes; it is parsed without decoding it first
+            result = subprocess.run(args, capture_output=True, timeout=30)
+        except subprocess.TimeoutExpired:
+            return {}, "Timeout"
+        stderr = result.stderr.decode(errors="replace")
+        try:
+            # gh exits non-zero if any field failed, but still prints the
+            # partial response
+            payload = _json_loads(result.stdout)
+        except ValueError:
+            return {}, stderr
+        return (payload if isinstance(payload, dict) else {}), stderr
 
-    def _get_commit_date(self, branch_name: str) -> Optional[str]:
-        """Get the commit date for a branch.
+    def _set_host(self, host: Optional[str]) -> None:
+        """Point direct API requests at the repository's host."""
+        if host == self.host:
+            return
+        # The token and client were for the previous host
+        self.close()
+        self.host = host
+        self._token = None
+        self._http_unavailable = httpx is None
+        self._etag_cache.clear()
+
+    def _api_url(self) -> str:
+        """Get the base URL of the REST API of the repository's host."""
+        host = self.host
+        if host is None or host == "github.com":
+            return self.API_URL
+        if host.endswith(".ghe.com"):
+            # GitHub Enterprise Cloud with data residency
+            return f"https://api.{host}"
+        # GitHub Enterprise Server
+        return f"https://{host}/api/v3"
+
+    def _graphql_url(self) -> str:
+        """Get the URL of the GraphQL API of the repository's host."""
+        api_url = self._api_url()
+        if api_url.endswith("/api/v3"):
+            return api_url[: -len("/v3")] + "/graphql"
+        return f"{api_url}/graphql"
+
+    def _gh_token(self) -> Optional[str]:
+        """Get the gh CLI's token for the repository's host.
+
+        Returns None if httpx is not installed, the host is not known yet or
+        gh has no token for it, in which case requests go through gh instead.
+        """
+        if self.host is None:
+            return None
+        if self._token is None and not self._http_unavailable:
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "token", "--hostname", self.host],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                if result.returncode == 0:
+                    self._token = result.stdout.strip() or None
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
+            if self._token is None:
+                self._http_unavailable = True
+        return None if self._http_unavailable else self._token
+
+    def _client_options(self, token: str) -> Dict[str, Any]:
+        """Get the options of a client for direct API requests."""
+        return {
+            "base_url": self._api_url(),
+            "headers": {
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            "http2": _HTTP2,
+            "timeout": 30,
+        }
+
+    def _http_client(self) -> Optional["httpx.Client"]:
+        """Get the client for direct API requests.
+
+        The client authenticates with the gh CLI's token. Returns None if
+        requests should go through gh instead.
+        """
+        if self._http is None:
+            token = self._gh_token()
+            if token:
+                self._http = httpx.Client(**self._client_options(token))
+        return self._http
+
+    async def _async_client(self) -> Optional["httpx.AsyncClient"]:
+        """Open a client for direct API requests from the running event loop.
 
         Returns:
-            ISO 8601 timestamp string or None if unavailable
+            The client, which the caller closes, or None if requests should go
+            through gh instead
         """
-        commit_sha = self._branch_commits.get(branch_name)
-        if not commit_sha:
+        token = await asyncio.to_thread(self._gh_token)
+        if not token:
             return None
+        return httpx.AsyncClient(**self._client_options(token))
+
+    def _checked_response(
+        self, response: "httpx.Response"
+    ) -> Optional["httpx.Response"]:
+        """Get a direct API response if it succeeded."""
+        if response.status_code == 401:
+            # The token doesn't work for this host; stop trying it
+            self._http_unavailable = True
+            self._token = None
+            self.close()
+            return None
+        if response.is_error:
+            return None
+        return response
+
+    def _http_request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> Optional["httpx.Response"]:
+        """Make a direct API request.
 
+        Returns:
+            The successful response, or None if the request should be made
+            through gh instead
+        """
+        client = self._http_client()
+        if client is None:
+            return None
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{self.repo_full}/commits/{commit_sha}",
-                    "--jq",
-                    ".commit.committer.date",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            response = client.request(method, url, **kwargs)
+        except httpx.HTTPError:
             return None
-        except (subprocess.TimeoutExpired, Exception):
+        return self._checked_response(response)
+
+    async def _ahttp_request(
+        self,
+        client: Optional["httpx.AsyncClient"],
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> Optional["httpx.Response"]:
+        """Make a direct API request over ``client``, as ``_http_request``."""
+        if client is None or self._http_unavailable:
             return None
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            return None
+        return self._checked_response(response)
 
-    def _get_compare_status(
-        self, branch_name: str
-    ) -> Tuple[str, Optional[int], Optional[int]]:
-        """Get the compare status of a branch against the default branch.
+    async def _ahttp_get_json(
+        self, client: Optional["httpx.AsyncClient"], url: str
+    ) -> Optional[Tuple[Any, Optional[str]]]:
+        """GET a page of a REST listing directly.
+
+        A page fetched before is revalidated with its ETag: if it is unchanged,
+        GitHub answers 304 with no body (and without counting it against the
+        rate limit) and the previously parsed page is reused.
 
         Returns:
-            Tuple of (status, ahead_by, behind_by)
+            Tuple of (parsed page, URL of the next page or None), or None if
+            the request should be made through gh instead. The page is the
+            cached object itself, so callers must not mutate it.
         """
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self._ahttp_request(client, "GET", url, headers=headers)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
         try:
-            # URL encode the comparison
-            import urllib.parse
+            data = _json_loads(response.content)
+        except ValueError:
+            return None
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, data, next_url)
+        return data, next_url
 
-            comparison = f"{self.default_branch}...{branch_name}"
-            encoded = urllib.parse.quote(comparison, safe="")
+    async def _ahttp_list(
+        self, client: Optional["httpx.AsyncClient"], url: str, limit: int
+    ) -> Optional[List[Any]]:
+        """GET up to ``limit`` items of a paginated REST listing directly.
 
-            result = subprocess.run(
-                ["gh", "api", f"repos/{self.repo_full}/compare/{encoded}"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                status = data.get("status", "unknown")
-                ahead_by = data.get("ahead_by")
-                behind_by = data.get("behind_by")
-                return status, ahead_by, behind_by
-            return "unknown", None, None
-        except (subprocess.TimeoutExpired, Exception):
-            return "unknown", None, None
+        Returns:
+            The items, or None if the listing should be made through gh instead
+        """
+        items: List[Any] = []
+        next_url: Optional[str] = url
+        while next_url is not None and len(items) < limit:
+            page = await self._ahttp_get_json(client, next_url)
+            if page is None:
+                return None
+            data, next_url = page
+            items.extend(data)
+        return items[:limit]
+
+    def close(self) -> None:
+        """Close the connection used for direct API requests, if any."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def delete_branch(self, branch_name: str) -> Tuple[bool, str]:
         """Delete a branch.
@@ -484,19 +1065,88 @@ class GitHubBranchManager:
     ) -> List[Tuple[str, bool, str]]:
         """Delete multiple branches.
 
+        Branches are deleted with batched GraphQL ``deleteRef`` mutations.
+        Branches the mutation could not delete (or whose ref could not be
+        found) go through ``delete_branch`` instead, up to ``max_concurrency``
+        at a time, so they get its error messages.
+
         Args:
             branch_names: List of branch names to delete
             progress_callback: Optional callback function to report progress.
-                               Called with (current, total, branch_name) integers and string.
+                               Called with (completed, total, branch_name) integers and string
+                               as each deletion finishes.
 
         Returns:
-            List of tuples: (branch_name, success, message)
+            List of tuples: (branch_name, success, message), in the order given
         """
-        results = []
         total = len(branch_names)
-        for idx, branch_name in enumerate(branch_names, 1):
+        outcomes: Dict[str, Tuple[bool, str]] = {}
+
+        def report(branch_name: str, success: bool, message: str) -> None:
+            outcomes[branch_name] = (success, message)
             if progress_callback:
-                progress_callback(idx, total, branch_name)
-            success, message = self.delete_branch(branch_name)
-            results.append((branch_name, success, message))
-        return results
+                progress_callback(len(outcomes), total, branch_name)
+
+        ref_ids = self._fetch_ref_ids(branch_names)
+        found = [b for b in dict.fromkeys(branch_names) if b in ref_ids]
+        fallback = [b for b in dict.fromkeys(branch_names) if b not in ref_ids]
+        for start in range(0, len(found), self.BATCH_SIZE):
+            batch = found[start : start + self.BATCH_SIZE]
+            fallback += self._delete_refs(batch, ref_ids, report)
+
+        if fallback:
+            workers = min(self._max_workers, len(fallback))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_branch = {
+                    executor.submit(self.delete_branch, branch_name): branch_name
+                    for branch_name in fallback
+                }
+                for future in as_completed(future_to_branch):
+                    report(future_to_branch[future], *future.result())
+
+        return [(b, *outcomes[b]) for b in branch_names]
+
+    def _delete_refs(
+        self,
+        branches: List[str],
+        ref_ids: Dict[str, str],
+        report: Callable[[str, bool, str], None],
+    ) -> List[str]:
+        """Delete a batch of branches with one GraphQL mutation.
+
+        Each deletion is reported through ``report``, except for branches
+        whose own ``deleteRef`` failed.
+
+        Returns:
+            Branches to retry through the REST API
+        """
+        declarations = ", ".join(f"$r{i}: ID!" for i in range(len(branches)))
+        fields = " ".join(
+            f"d{i}: deleteRef(input: {{refId: $r{i}}}) {{ clientMutationId }}"
+            for i in range(len(branches))
+        )
+        payload, stderr = self._graphql(
+            f"mutation({declarations}) {{ {fields} }}",
+            {f"r{i}": ref_ids[branch_name] for i, branch_name in enumerate(branches)},
+        )
+        if "data" not in payload:
+            for branch_name in branches:
+                report(branch_name, False, f"Failed to delete {branch_name}: {stderr}")
+            return []
+
+        # Errors name the alias of the mutation that failed
+        failed = {
+            error["path"][0]
+            for error in payload.get("errors") or []
+            if error.get("path")
+        }
+        data = payload["data"] or {}
+        retry = []
+        for i, branch_name in enumerate(branches):
+            alias = f"d{i}"
+            if alias in failed or data.get(alias) is None:
+                retry.append(branch_name)
+            else:
+                self._ref_ids.pop(branch_name, None)
+                report(branch_name, True, f"Successfully deleted {branch_name}")
+        return retry
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Tests for the GitHub Branch Manager TUI."""
 
+import asyncio
+import dataclasses
+import io
+import json
+import os
 import sys
+import tempfile
+from unittest import mock
 
-from gh_branch_manager.app import BranchManagerApp
+from gh_branch_manager import cache, github_api
+from gh_branch_manager.app import BranchManagerApp, NameColumns, _add_trigrams
 from gh_branch_manager.github_api import (
     BranchInfo,
     GitHubBranchManager,
@@ -92,6 +100,14 @@ def test_app_creation():
     assert feature_branch.is_merged is False
     print("  ✓ Feature branch properties verified")
 
+    # Test status formatting
+    assert app._status_markup(app.branches_data[1]) == "[yellow]ahead[/]"
+    diverged = BranchInfo(
+        name="feature/diverged", status="diverged", ahead_by=2, behind_by=3
+    )
+    assert app._status_markup(diverged) == "[red]diverged ↑2 ↓3[/]"
+    print("  ✓ Status formatting works")
+
     # Test selection
     app.selected_branches.add("feature/test")
     assert "feature/test" in app.selected_branches
@@ -146,6 +162,41 @@ def test_filtering():
     assert all("feature" in b.name for b in filtered)
     print("  ✓ Filtering works correctly")
 
+    # Case-insensitive filtering uses the cached lowercase name
+    mixed = BranchInfo(name="Feature/CamelCase", status="ahead")
+    assert mixed.name_lower == "feature/camelcase"
+    assert "camel" in mixed.name_lower
+    print("  ✓ Lowercase name is cached")
+
+    # The app filters long needles through a trigram index, short ones by scan
+    app = BranchManagerApp()
+    by_name = sorted(branches, key=lambda b: b.name)
+    for needle, expected in (
+        ("FEATURE", ["feature/auth", "feature/ui"]),
+        ("ui", ["feature/ui"]),
+        ("login", ["bugfix/login"]),
+        ("tuae", []),
+        ("", ["bugfix/login", "feature/auth", "feature/ui", "main"]),
+    ):
+        rows = app._compute_rows(by_name, needle, set())
+        assert [cells[1] for cells in rows] == expected, needle
+    # Filtering the columns keeps the order of the branches passed in
+    columns = NameColumns.of(by_name)
+    rows = app._compute_rows(by_name[::-1], "ure", set(), columns)
+    assert [cells[1] for cells in rows] == ["feature/ui", "feature/auth"]
+    # Names added after a snapshot was taken only show up in later ones
+    late = BranchInfo(name="feature/late", status="ahead")
+    columns.names.append(late.name)
+    columns.names_lower.append(late.name_lower)
+    _add_trigrams(columns.trigrams, columns.count, late.name_lower)
+    view = by_name + [late]
+    rows = app._compute_rows(view, "feature", set(), columns)
+    assert [cells[1] for cells in rows] == ["feature/auth", "feature/ui"]
+    later = dataclasses.replace(columns, count=columns.count + 1)
+    rows = app._compute_rows(view, "feature", set(), later)
+    assert [cells[1] for cells in rows][-1] == "feature/late"
+    print("  ✓ App filtering works with and without the trigram index")
+
     print("✅ Filtering tests passed\n")
 
 
@@ -192,9 +243,361 @@ def test_sorting():
     assert merged_count == 2
     print("  ✓ Sort by merged status works")
 
+    # The app keeps its sort index in order as branches change
+    app = BranchManagerApp()
+    app.branches_data = list(branches)
+    app.branches_dict = {b.name: idx for idx, b in enumerate(branches)}
+    app.sort_mode = "status"
+    assert [b.name for b in app._sorted_view()] == ["a-branch", "z-branch", "m-branch"]
+    changed = BranchInfo(name="m-branch", status="protected")
+    app.branches_data[app.branches_dict["m-branch"]] = changed
+    app._branches_version += 1
+    app._index_branch(changed)
+    assert [b.name for b in app._sorted_view()] == ["m-branch", "a-branch", "z-branch"]
+    print("  ✓ Sort index stays ordered across updates")
+
+    # Descending modes keep ties in ascending name order
+    app.sort_mode = "updated"
+    assert [b.name for b in app._sorted_view()] == ["a-branch", "m-branch", "z-branch"]
+    print("  ✓ Ties sort by name in descending modes")
+
     print("✅ Sorting tests passed\n")
 
 
+def test_branch_cache():
+    """Test the on-disk branch cache."""
+    print("Testing branch cache...")
+
+    branches = [
+        BranchInfo(
+            name="feature/cached",
+            status="diverged",
+            merge_status=MergeStatus.MERGED,
+            pr_status=PRStatus.CLOSED,
+            ahead_by=1,
+            behind_by=2,
+            last_commit_date="2024-01-01T00:00:00Z",
+        ),
+    ]
+
+    old_cache_home = os.environ.get("XDG_CACHE_HOME")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CACHE_HOME"] = tmp
+        try:
+            assert cache.load_branches("owner/repo") is None
+            print("  ✓ Missing cache is ignored")
+
+            cache.save_branches("owner/repo", branches)
+            assert cache.load_branches("owner/repo") == branches
+            print("  ✓ Cached branches round-trip")
+
+            assert cache.load_branches("owner/repo", max_age=-1) is None
+            print("  ✓ Expired cache is ignored")
+
+            cache.invalidate("owner/repo")
+            cache.invalidate("owner/repo")
+            assert cache.load_branches("owner/repo") is None
+            print("  ✓ Invalidated cache is gone")
+        finally:
+            if old_cache_home is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = old_cache_home
+
+    print("✅ Branch cache tests passed\n")
+
+
+def test_batched_fetch():
+    """Test fetching branch details in batched requests."""
+    print("Testing batched branch fetching...")
+
+    gh = GitHubBranchManager()
+    gh.repo_full = "owner/repo"
+    gh.default_branch = "main"
+    gh.BATCH_SIZE = 2
+    gh._http_unavailable = True  # Go through the (mocked) gh CLI
+    compares = {
+        "refs/heads/feature/a": {"aheadBy": 2, "behindBy": 0, "status": "AHEAD"},
+        "refs/heads/feature/b": {"aheadBy": 1, "behindBy": 3, "status": "DIVERGED"},
+    }
+
+    def fake_run(args, **kwargs):
+        if args[:3] == ["gh", "pr", "list"]:
+            prs = "feature/b\tMERGED\t2024-01-01T00:00:00Z\nfeature/a\tCLOSED\t\n"
+            return subprocess_result(prs)
+
+        variables = dict(arg.split("=", 1) for arg in args if "=" in arg)
+        repository = {"base": {}}
+        for key, value in variables.items():
+            if key.startswith("h") and value != "refs/heads/feature/gone":
+                date = {"committedDate": "2024-01-01T00:00:00Z"}
+                repository[f"d{key[1:]}"] = {"target": date}
+                repository["base"][f"b{key[1:]}"] = compares.get(value)
+        payload = {"data": {"repository": repository}}
+        return subprocess_result(json.dumps(payload).encode())
+
+    names = ["main", "feature/a", "feature/b", "feature/gone"]
+
+    def fake_popen(args, **kwargs):
+        return mock.Mock(
+            stdout=io.StringIO("".join(f"{n}|sha\n" for n in names)),
+            **{"wait.return_value": 0, "poll.return_value": 0},
+        )
+
+    with mock.patch("subprocess.run", side_effect=fake_run) as run:
+        with mock.patch("subprocess.Popen", side_effect=fake_popen):
+            branches = {b.name: b for b in gh.fetch_branches(full_status=True)}
+    # PR list and one request per batch of two branches
+    assert run.call_count == 3
+    assert branches["main"].status == "protected"
+    assert branches["main"].last_commit_date == "2024-01-01T00:00:00Z"
+    assert (branches["feature/a"].status, branches["feature/a"].ahead_by) == (
+        "ahead",
+        2,
+    )
+    assert branches["feature/b"].status == "diverged"
+    assert branches["feature/b"].is_merged
+    assert branches["feature/a"].is_pr_closed and not branches["feature/a"].is_merged
+    assert branches["feature/gone"].status == "unknown"
+    assert branches["feature/gone"].last_commit_date is None
+    print("  ✓ Statuses and commit dates are fetched in batches")
+
+    updates = []
+    with mock.patch("subprocess.run", side_effect=fake_run):
+        with mock.patch("subprocess.Popen", side_effect=fake_popen):
+            branches = {
+                b.name: b
+                for b in gh.fetch_branches(
+                    incremental_callback=lambda b, fields: updates.append((b, fields))
+                )
+            }
+    assert branches["feature/b"].status == "merged"
+    assert branches["feature/b"].ahead_by is None
+    assert branches["feature/a"].status == "ahead"
+    print("  ✓ Merged branches skip the compare by default")
+
+    # Each branch is reported when listed, then once with what changed (in
+    # the order its batch completed)
+    assert [b.name for b, _ in updates[: len(names)]] == names
+    assert sorted(b.name for b, _ in updates[len(names) :]) == sorted(names)
+    assert {b.name: fields for b, fields in updates[len(names) :]}["feature/a"] == {
+        "status",
+        "merge_status",
+        "pr_status",
+        "ahead_by",
+        "behind_by",
+        "last_commit_date",
+    }
+    print("  ✓ Updates carry only the fields that changed")
+
+    # Reports are snapshots, which the fetch doesn't fill in afterwards
+    assert all(b.status == "fetching" for b, _ in updates[: len(names)])
+    assert all(b is not branches[b.name] for b, _ in updates)
+    print("  ✓ Updates are snapshots of the branches")
+
+    gh = GitHubBranchManager()
+    repo_view = subprocess_result("owner/repo\nmain\nhttps://github.com/owner/repo\n")
+    with mock.patch("subprocess.run", return_value=repo_view) as run:
+        assert gh.get_repo_info() == ("owner/repo", "main")
+        assert gh.get_repo_info() == ("owner/repo", "main")
+    assert run.call_count == 1
+    assert gh.host == "github.com"
+    print("  ✓ Repository info is fetched once and reused")
+
+    with mock.patch("subprocess.run", return_value=subprocess_result("")) as run:
+        assert gh.check_gh_auth() and gh.check_gh_auth()
+        gh.invalidate_auth_cache()
+        assert gh.check_gh_auth()
+    assert run.call_count == 2
+    print("  ✓ Auth status is remembered until invalidated")
+
+    class CustomManager(GitHubBranchManager):
+        DEFAULT_PROTECTED_REGEX = r"^release/.*$"
+
+    assert gh._is_protected("develop") and not gh._is_protected("release/1.0")
+    custom = CustomManager()
+    assert custom._is_protected("release/1.0") and not custom._is_protected("main")
+    print("  ✓ Protected names are matched, including overridden patterns")
+
+    print("✅ Batched fetching tests passed\n")
+
+
+def test_direct_http():
+    """Test talking to the GitHub API without gh."""
+    print("Testing direct API requests...")
+
+    if github_api.httpx is None:
+        print("  - httpx is not installed, skipping")
+        return
+
+    revalidated = []
+
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            revalidated.append(request.url.path)
+            return github_api.httpx.Response(304)
+        response = route(request)
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    def route(request):
+        if request.url.path == "/repos/owner/repo/branches":
+            if request.url.params.get("page") == "2":
+                return github_api.httpx.Response(
+                    200, json=[{"name": "feature/b", "commit": {"sha": "2"}}]
+                )
+            return github_api.httpx.Response(
+                200,
+                json=[{"name": "main", "commit": {"sha": "1"}}],
+                headers={
+                    "Link": "<https://api.test/repos/owner/repo/branches"
+                    '?page=2>; rel="next"'
+                },
+            )
+        if request.url.path == "/repos/owner/repo/pulls":
+            pulls = [
+                {"head": {"ref": "feature/b"}, "state": "closed", "merged_at": "x"},
+                {"head": {"ref": "feature/c"}, "state": "closed", "merged_at": None},
+                {"head": {"ref": "feature/d"}, "state": "open", "merged_at": None},
+            ]
+            return github_api.httpx.Response(200, json=pulls)
+        return github_api.httpx.Response(404)
+
+    async def list_branches(gh):
+        async with github_api.httpx.AsyncClient(
+            base_url="https://api.test",
+            transport=github_api.httpx.MockTransport(handler),
+        ) as client:
+            names = [name async for name in gh._afetch_all_branches(client)]
+            await gh._afetch_pr_branches(client)
+        return names
+
+    gh = GitHubBranchManager()
+    gh.repo_full = "owner/repo"
+    with mock.patch("subprocess.run") as run:
+        assert asyncio.run(list_branches(gh)) == ["main", "feature/b"]
+    assert run.call_count == 0
+    assert gh._branch_commits == {"main": "1", "feature/b": "2"}
+    assert gh._merged_branches == {"feature/b"}
+    assert gh._closed_pr_branches == {"feature/c"}
+    print("  ✓ Branches and PRs are listed over one client")
+
+    gh._branch_commits = {}
+    gh._merged_branches = set()
+    assert asyncio.run(list_branches(gh)) == ["main", "feature/b"]
+    assert revalidated == ["/repos/owner/repo/branches"] * 2 + [
+        "/repos/owner/repo/pulls"
+    ]
+    assert gh._branch_commits == {"main": "1", "feature/b": "2"}
+    assert gh._merged_branches == {"feature/b"}
+    print("  ✓ Unchanged listings are revalidated with their ETags")
+
+    # Requests go to the repository's host, with gh's token for that host
+    enterprise = GitHubBranchManager()
+    assert enterprise._gh_token() is None
+    enterprise._set_host("ghe.example.com")
+    token = subprocess_result("ghe-token\n")
+    with mock.patch("subprocess.run", return_value=token) as run:
+        options = enterprise._client_options(enterprise._gh_token())
+    assert run.call_args[0][0] == [
+        "gh",
+        "auth",
+        "token",
+        "--hostname",
+        "ghe.example.com",
+    ]
+    assert options["base_url"] == "https://ghe.example.com/api/v3"
+    assert options["headers"]["Authorization"] == "Bearer ghe-token"
+    assert enterprise._graphql_url() == "https://ghe.example.com/api/graphql"
+    enterprise._set_host("github.com")
+    assert enterprise._token is None
+    assert enterprise._client_options("t")["base_url"] == "https://api.github.com"
+    assert enterprise._graphql_url() == "https://api.github.com/graphql"
+    print("  ✓ Requests and tokens follow the repository's host")
+
+    # A repository the token can't see is looked up through gh instead
+    gh._http = github_api.httpx.Client(
+        base_url="https://api.test",
+        transport=github_api.httpx.MockTransport(
+            lambda request: github_api.httpx.Response(
+                200, json={"data": {"repository": None}}
+            )
+        ),
+    )
+    from_gh = {"data": {"repository": {"id": "R1"}}}
+    with mock.patch(
+        "subprocess.run", return_value=subprocess_result(json.dumps(from_gh).encode())
+    ) as run:
+        assert gh._graphql_repository("id", {}) == from_gh
+    assert run.call_args[0][0][:3] == ["gh", "api", "graphql"]
+    gh.close()
+    print("  ✓ Null repositories from direct requests fall back to gh")
+
+    print("✅ Direct API tests passed\n")
+
+
+def test_bulk_delete():
+    """Test deleting several branches at once."""
+    print("Testing bulk deletion...")
+
+    gh = GitHubBranchManager()
+    gh.repo_full = "owner/repo"
+    gh.BATCH_SIZE = 4
+    gh._http_unavailable = True  # Go through the (mocked) gh CLI
+    names = [f"feature/{i}" for i in range(10)] + ["feature/missing"]
+    rest_deletes = []
+
+    def fake_run(args, **kwargs):
+        variables = dict(arg.split("=", 1) for arg in args if "=" in arg)
+        if args[:3] != ["gh", "api", "graphql"]:
+            rest_deletes.append(args[-1].rsplit("/", 1)[-1])
+            returncode = 1 if args[-1].endswith("feature/missing") else 0
+            return subprocess_result("", returncode=returncode)
+        if variables["query"].startswith("mutation"):
+            # The mutation for feature/3 is rejected and retried over REST
+            data = {f"d{key[1:]}": {} for key in variables if key.startswith("r")}
+            errors = []
+            for key, value in variables.items():
+                if value == "id-feature/3":
+                    data[f"d{key[1:]}"] = None
+                    errors.append({"path": [f"d{key[1:]}"], "message": "denied"})
+            return subprocess_result(
+                json.dumps({"data": data, "errors": errors}).encode(), 1
+            )
+
+        repository = {
+            f"r{key[1:]}": {"id": f"id-{value[len('refs/heads/') :]}"}
+            for key, value in variables.items()
+            if key.startswith("h") and value != "refs/heads/feature/missing"
+        }
+        return subprocess_result(
+            json.dumps({"data": {"repository": repository}}).encode()
+        )
+
+    progress = []
+    with mock.patch("subprocess.run", side_effect=fake_run) as run:
+        results = gh.delete_branches(
+            names, progress_callback=lambda *args: progress.append(args)
+        )
+    assert [name for name, _, _ in results] == names
+    assert [success for _, success, _ in results] == [True] * 10 + [False]
+    assert sorted(current for current, _, _ in progress) == list(range(1, 12))
+    print("  ✓ Results keep the requested order")
+
+    # 3 ID lookups, 3 mutations and 2 REST fallbacks
+    assert run.call_count == 8
+    assert sorted(rest_deletes) == ["3", "missing"]
+    print("  ✓ Branches are deleted by batched mutations")
+
+    print("✅ Bulk deletion tests passed\n")
+
+
+def subprocess_result(stdout, returncode: int = 0) -> mock.Mock:
+    """Build a fake ``subprocess.run`` result, in bytes if ``stdout`` is."""
+    stderr = b"" if isinstance(stdout, bytes) else ""
+    return mock.Mock(stdout=stdout, stderr=stderr, returncode=returncode)
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -206,6 +609,10 @@ def main():
         test_app_creation()
         test_filtering()
         test_sorting()
+        test_branch_cache()
+        test_batched_fetch()
+        test_direct_http()
+        test_bulk_delete()
 
         print("=" * 60)
         print("✅ All tests passed!")